@@ -31,6 +31,7 @@ from .const import (
     validate_time_format,
 )
 from .coordinator import PowerSaverCoordinator
+from .nordpool_adapter import NATIVE_PRICE_CACHE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -194,7 +195,7 @@ async def _async_options_updated(
 ) -> None:
     """Handle options update — trigger coordinator refresh."""
     coordinator: PowerSaverCoordinator = hass.data[DOMAIN][entry.entry_id]
-    await coordinator.async_request_refresh()
+    await coordinator.async_refresh()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -203,11 +204,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
-    # Remove services when the last entry is unloaded.
+    # Remove services and cached prices when the last entry is unloaded.
     if unload_ok and not hass.data.get(DOMAIN):
         hass.services.async_remove(DOMAIN, SERVICE_SET_SCHEDULE_HOURS)
         hass.services.async_remove(DOMAIN, SERVICE_CLEAR_SCHEDULE_HOURS_OVERRIDE)
         hass.services.async_remove(DOMAIN, SERVICE_SET_EXCLUDE_TIMES)
         hass.services.async_remove(DOMAIN, SERVICE_CLEAR_EXCLUDE_TIMES_OVERRIDE)
+        hass.data.pop(NATIVE_PRICE_CACHE, None)
 
     return unload_ok
@@ -8,12 +8,11 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_NAME, DOMAIN
+from .const import DOMAIN
 from .coordinator import PowerSaverCoordinator
 
 
@@ -45,17 +44,10 @@ class EmergencyModeBinarySensor(
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_emergency_mode"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=entry.data[CONF_NAME],
-            manufacturer="Power Saver",
-            model="Price Optimizer",
-            entry_type="service",
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
         """Return True if emergency mode is active."""
-        if self.coordinator.data is None:
-            return False
-        return self.coordinator.data.emergency_mode
+        data = self.coordinator.data
+        return data is not None and data.emergency_mode
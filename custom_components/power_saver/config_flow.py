@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -19,7 +21,8 @@ try:
 except ImportError:
     from homeassistant.config_entries import OptionsFlowWithConfigEntry as OptionsFlowWithReload
     _LEGACY_OPTIONS_FLOW = True
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.selector import (
     EntitySelector,
     EntitySelectorConfig,
@@ -60,6 +63,7 @@ from .const import (
     DEFAULT_SELECTION_MODE,
     DEFAULT_STRATEGY,
     DOMAIN,
+    NORDPOOL_TYPES,
     SELECTION_MODE_CHEAPEST,
     SELECTION_MODE_MOST_EXPENSIVE,
     STRATEGY_LOWEST_PRICE,
@@ -70,43 +74,307 @@ from .nordpool_adapter import detect_nordpool_type, find_all_nordpool_sensors
 _LOGGER = logging.getLogger(__name__)
 
 
-def _optional_number(key: str, defaults: dict[str, Any]) -> vol.Optional:
+def _optional_suggested(key: str, defaults: Mapping[str, Any]) -> vol.Optional:
     """Create vol.Optional with suggested value pre-fill (allows clearing)."""
     val = defaults.get(key)
-    if val is not None:
-        return vol.Optional(key, description={"suggested_value": val})
-    return vol.Optional(key)
+    if val is None:
+        return vol.Optional(key)
+    return vol.Optional(key, description={"suggested_value": val})
 
 
-def _optional_time(key: str, defaults: dict[str, Any]) -> vol.Optional:
-    """Create vol.Optional for time fields with suggested value pre-fill (allows clearing)."""
-    val = defaults.get(key)
-    if val is not None:
-        return vol.Optional(key, description={"suggested_value": val})
-    return vol.Optional(key)
-
-
-def _strategy_selector() -> SelectSelector:
-    """Build strategy dropdown selector."""
-    return SelectSelector(
-        SelectSelectorConfig(
-            options=[
-                SelectOptionDict(
-                    value=STRATEGY_LOWEST_PRICE,
-                    label=STRATEGY_LOWEST_PRICE,
-                ),
-                SelectOptionDict(
-                    value=STRATEGY_MINIMUM_RUNTIME,
-                    label=STRATEGY_MINIMUM_RUNTIME,
-                ),
-            ],
-            mode="dropdown",
-            translation_key=CONF_STRATEGY,
+@lru_cache(maxsize=64)
+def _build_unique_id(nordpool_entity: str, name: str) -> str:
+    """Build the entry unique id from the Nord Pool sensor and the name."""
+    return f"{nordpool_entity}_{slugify(name)}"
+
+
+# Selectors are stateless and their configs constant, so build them once.
+_HOURS_PER_PERIOD_SELECTOR = NumberSelector(
+    NumberSelectorConfig(min=0, max=24, step=0.25, mode=NumberSelectorMode.BOX)
+)
+_HOURS_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0.25, max=24, step=0.25, mode=NumberSelectorMode.BOX,
+        unit_of_measurement="hours",
+    )
+)
+_ROLLING_WINDOW_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=2, max=72, step=0.5, mode=NumberSelectorMode.BOX,
+        unit_of_measurement="hours",
+    )
+)
+_ALWAYS_CHEAP_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=-10, max=100, step=0.01, mode=NumberSelectorMode.BOX,
+        unit_of_measurement="SEK/kWh",
+    )
+)
+_ALWAYS_EXPENSIVE_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0, max=100, step=0.01, mode=NumberSelectorMode.BOX,
+        unit_of_measurement="SEK/kWh",
+    )
+)
+_PRICE_SIMILARITY_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0, max=100, step=1, mode=NumberSelectorMode.BOX,
+        unit_of_measurement="%",
+    )
+)
+# Domains of entities that can be controlled (turned on/off by the schedule)
+_CONTROLLED_DOMAINS = frozenset({"switch", "input_boolean", "light"})
+_CONTROLLED_ENTITIES_SELECTOR = EntitySelector(
+    EntitySelectorConfig(
+        domain=sorted(_CONTROLLED_DOMAINS),
+        multiple=True,
+    )
+)
+_STRATEGY_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=[
+            SelectOptionDict(
+                value=STRATEGY_LOWEST_PRICE,
+                label=STRATEGY_LOWEST_PRICE,
+            ),
+            SelectOptionDict(
+                value=STRATEGY_MINIMUM_RUNTIME,
+                label=STRATEGY_MINIMUM_RUNTIME,
+            ),
+        ],
+        mode="dropdown",
+        translation_key=CONF_STRATEGY,
+    )
+)
+_SELECTION_MODE_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=[
+            SelectOptionDict(
+                value=SELECTION_MODE_CHEAPEST,
+                label=SELECTION_MODE_CHEAPEST,
+            ),
+            SelectOptionDict(
+                value=SELECTION_MODE_MOST_EXPENSIVE,
+                label=SELECTION_MODE_MOST_EXPENSIVE,
+            ),
+        ],
+        mode="dropdown",
+        translation_key=CONF_SELECTION_MODE,
+    )
+)
+_TIME_SELECTOR = TimeSelector()
+_TEXT_SELECTOR = TextSelector()
+
+# Settings step shown for each strategy (same step ids in both flows)
+_STRATEGY_STEPS = {
+    STRATEGY_LOWEST_PRICE: "async_step_lowest_price",
+    STRATEGY_MINIMUM_RUNTIME: "async_step_minimum_runtime",
+}
+
+# Required options collected by each strategy's settings step
+_STRATEGY_OPTION_KEYS = {
+    STRATEGY_LOWEST_PRICE: (CONF_HOURS_PER_PERIOD, CONF_PERIOD_FROM, CONF_PERIOD_TO),
+    STRATEGY_MINIMUM_RUNTIME: (CONF_ROLLING_WINDOW, CONF_MIN_HOURS_ON),
+}
+
+# Common options only stored when the user filled them in
+_COMMON_OPTIONAL_KEYS = (
+    CONF_ALWAYS_CHEAP,
+    CONF_ALWAYS_EXPENSIVE,
+    CONF_PRICE_SIMILARITY_PCT,
+    CONF_EXCLUDE_FROM,
+    CONF_EXCLUDE_UNTIL,
+)
+
+# Options read by the common options step (the only ones keying its schema cache)
+_COMMON_OPTIONS_KEYS = (
+    CONF_SELECTION_MODE,
+    CONF_ALWAYS_CHEAP,
+    CONF_ALWAYS_EXPENSIVE,
+    CONF_PRICE_SIMILARITY_PCT,
+    CONF_EXCLUDE_FROM,
+    CONF_EXCLUDE_UNTIL,
+    CONF_CONTROLLED_ENTITIES,
+)
+
+
+def _validate_minimum_runtime(user_input: dict[str, Any]) -> dict[str, str]:
+    """Validate Minimum Runtime settings, returning form errors (empty if valid)."""
+    if user_input[CONF_ROLLING_WINDOW] < user_input[CONF_MIN_HOURS_ON]:
+        return {"base": "rolling_window_too_small"}
+    return {}
+
+
+def _lowest_price_schema(defaults: Mapping[str, Any]) -> vol.Schema:
+    """Return the Lowest Price settings schema pre-filled from defaults."""
+    return _build_lowest_price_schema(
+        defaults.get(CONF_HOURS_PER_PERIOD, DEFAULT_HOURS_PER_PERIOD),
+        defaults.get(CONF_PERIOD_FROM, DEFAULT_PERIOD_FROM),
+        defaults.get(CONF_PERIOD_TO, DEFAULT_PERIOD_TO),
+        defaults.get(CONF_MIN_CONSECUTIVE_HOURS),
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_lowest_price_schema(
+    hours_per_period: float,
+    period_from: str,
+    period_to: str,
+    min_consecutive_hours: float | None,
+) -> vol.Schema:
+    """Build the Lowest Price settings schema from its default values."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_HOURS_PER_PERIOD, default=hours_per_period
+            ): _HOURS_PER_PERIOD_SELECTOR,
+            vol.Required(CONF_PERIOD_FROM, default=period_from): _TIME_SELECTOR,
+            vol.Required(CONF_PERIOD_TO, default=period_to): _TIME_SELECTOR,
+            _optional_suggested(
+                CONF_MIN_CONSECUTIVE_HOURS,
+                {CONF_MIN_CONSECUTIVE_HOURS: min_consecutive_hours},
+            ): _HOURS_SELECTOR,
+        }
+    )
+
+
+def _minimum_runtime_schema(defaults: Mapping[str, Any]) -> vol.Schema:
+    """Return the Minimum Runtime settings schema pre-filled from defaults."""
+    return _build_minimum_runtime_schema(
+        defaults.get(CONF_MIN_HOURS_ON, DEFAULT_MIN_HOURS_ON),
+        defaults.get(CONF_ROLLING_WINDOW, DEFAULT_ROLLING_WINDOW),
+        defaults.get(CONF_MIN_CONSECUTIVE_HOURS),
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_minimum_runtime_schema(
+    min_hours_on: float,
+    rolling_window: float,
+    min_consecutive_hours: float | None,
+) -> vol.Schema:
+    """Build the Minimum Runtime settings schema from its default values."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_MIN_HOURS_ON, default=min_hours_on): _HOURS_SELECTOR,
+            vol.Required(
+                CONF_ROLLING_WINDOW, default=rolling_window
+            ): _ROLLING_WINDOW_SELECTOR,
+            _optional_suggested(
+                CONF_MIN_CONSECUTIVE_HOURS,
+                {CONF_MIN_CONSECUTIVE_HOURS: min_consecutive_hours},
+            ): _HOURS_SELECTOR,
+        }
+    )
+
+
+# Initial setup strategy steps always start from the defaults, so their
+# schemas are constant.
+_LOWEST_PRICE_SCHEMA = _lowest_price_schema({})
+_MINIMUM_RUNTIME_SCHEMA = _minimum_runtime_schema({})
+
+
+def _common_options_schema(defaults: Mapping[str, Any]) -> vol.Schema:
+    """Return the common options schema pre-filled from defaults.
+
+    The schema only depends on a handful of options, so it is memoized on
+    those values and re-rendering the form reuses the already built schema.
+    """
+    return _build_common_options_schema(
+        tuple(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key in _COMMON_OPTIONS_KEYS
+            if (value := defaults.get(key)) is not None
         )
     )
 
 
-class PowerSaverConfigFlow(ConfigFlow, domain=DOMAIN):
+@lru_cache(maxsize=32)
+def _build_common_options_schema(
+    defaults_items: tuple[tuple[str, Any], ...],
+) -> vol.Schema:
+    """Build the common options schema from hashable (key, default) pairs."""
+    defaults = {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in defaults_items
+    }
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_SELECTION_MODE,
+                default=defaults.get(CONF_SELECTION_MODE, DEFAULT_SELECTION_MODE),
+            ): _SELECTION_MODE_SELECTOR,
+            _optional_suggested(CONF_ALWAYS_CHEAP, defaults): _ALWAYS_CHEAP_SELECTOR,
+            _optional_suggested(CONF_ALWAYS_EXPENSIVE, defaults): _ALWAYS_EXPENSIVE_SELECTOR,
+            _optional_suggested(CONF_PRICE_SIMILARITY_PCT, defaults): _PRICE_SIMILARITY_SELECTOR,
+            _optional_suggested(CONF_EXCLUDE_FROM, defaults): _TIME_SELECTOR,
+            _optional_suggested(CONF_EXCLUDE_UNTIL, defaults): _TIME_SELECTOR,
+            vol.Optional(
+                CONF_CONTROLLED_ENTITIES,
+                default=defaults.get(CONF_CONTROLLED_ENTITIES, []),
+            ): _CONTROLLED_ENTITIES_SELECTOR,
+        }
+    )
+
+
+class _NordPoolSensorsMixin:
+    """Keep the Nord Pool sensor scan for the lifetime of a flow."""
+
+    hass: HomeAssistant
+    _nordpool_sensors: list[tuple[str, str, str]] | None = None
+    _sensor_options: tuple[list[tuple[str, str, str]], list[SelectOptionDict]] | None = None
+    _unsub_registry: CALLBACK_TYPE | None = None
+
+    def _get_nordpool_sensors(self) -> list[tuple[str, str, str]]:
+        """Return the Nord Pool sensors, scanning the registry only when needed.
+
+        The result is kept for the lifetime of the flow and dropped whenever
+        the entity registry changes. An empty result is not kept, so the
+        form picks up a Nord Pool sensor that finishes loading later.
+        """
+        if self._nordpool_sensors is not None:
+            return self._nordpool_sensors
+
+        sensors = find_all_nordpool_sensors(self.hass)
+        if sensors:
+            self._nordpool_sensors = sensors
+            if self._unsub_registry is None:
+                self._unsub_registry = self.hass.bus.async_listen(
+                    er.EVENT_ENTITY_REGISTRY_UPDATED,
+                    self._async_entity_registry_updated,
+                )
+        return sensors
+
+    def _get_sensor_options(
+        self, sensors: list[tuple[str, str, str]]
+    ) -> list[SelectOptionDict]:
+        """Return the dropdown options for a scan, reused while the scan is."""
+        cached = self._sensor_options
+        if cached is None or cached[0] is not sensors:
+            cached = self._sensor_options = (
+                sensors,
+                [
+                    SelectOptionDict(value=entity_id, label=label)
+                    for entity_id, _, label in sensors
+                ],
+            )
+        return cached[1]
+
+    @callback
+    def _async_entity_registry_updated(self, _event: Event) -> None:
+        """Drop the cached Nord Pool sensors when the entity registry changes."""
+        self._nordpool_sensors = None
+
+    @callback
+    def async_remove(self) -> None:
+        """Stop listening for entity registry changes when the flow ends."""
+        if self._unsub_registry is not None:
+            self._unsub_registry()
+            self._unsub_registry = None
+        super().async_remove()
+
+
+class PowerSaverConfigFlow(_NordPoolSensorsMixin, ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Power Saver."""
 
     VERSION = 3
@@ -119,9 +387,7 @@ class PowerSaverConfigFlow(ConfigFlow, domain=DOMAIN):
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> PowerSaverOptionsFlow:
         """Get the options flow for this handler."""
-        if _LEGACY_OPTIONS_FLOW:
-            return PowerSaverOptionsFlow(config_entry)
-        return PowerSaverOptionsFlow()
+        return _create_options_flow(config_entry)
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -129,23 +395,21 @@ class PowerSaverConfigFlow(ConfigFlow, domain=DOMAIN):
         """Step 1: Sensor + Name + Strategy."""
         errors: dict[str, str] = {}
 
-        all_sensors = find_all_nordpool_sensors(self.hass)
-
         if user_input is not None:
             nordpool_entity = user_input.get(CONF_NORDPOOL_SENSOR)
             if not nordpool_entity:
                 errors["base"] = "nordpool_not_found"
             else:
+                # Abort on a duplicate before doing the sensor type detection
+                name = user_input[CONF_NAME]
+                await self.async_set_unique_id(_build_unique_id(nordpool_entity, name))
+                self._abort_if_unique_id_configured()
+
                 nordpool_type = detect_nordpool_type(self.hass, nordpool_entity)
-                if nordpool_type == "unknown":
+                if nordpool_type not in NORDPOOL_TYPES:
                     errors["base"] = "nordpool_not_found"
 
             if not errors:
-                name = user_input[CONF_NAME]
-                unique_id = f"{nordpool_entity}_{slugify(name)}"
-                await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
-
                 self._user_input = {
                     CONF_NORDPOOL_SENSOR: nordpool_entity,
                     CONF_NORDPOOL_TYPE: nordpool_type,
@@ -154,17 +418,14 @@ class PowerSaverConfigFlow(ConfigFlow, domain=DOMAIN):
                 }
 
                 strategy = user_input[CONF_STRATEGY]
-                if strategy == STRATEGY_MINIMUM_RUNTIME:
-                    return await self.async_step_minimum_runtime()
-                return await self.async_step_lowest_price()
+                return await getattr(self, _STRATEGY_STEPS[strategy])()
 
+        # Only needed to render the form, so skip the scan on a valid submit
+        all_sensors = self._get_nordpool_sensors()
         if not all_sensors:
             errors["base"] = "nordpool_not_found"
 
-        sensor_options = [
-            SelectOptionDict(value=entity_id, label=label)
-            for entity_id, _, label in all_sensors
-        ]
+        sensor_options = self._get_sensor_options(all_sensors)
 
         sensor_default: str | vol.Undefined = vol.UNDEFINED
         if len(all_sensors) == 1:
@@ -180,10 +441,10 @@ class PowerSaverConfigFlow(ConfigFlow, domain=DOMAIN):
                         mode="dropdown",
                     )
                 ),
-                vol.Required(CONF_NAME): TextSelector(),
+                vol.Required(CONF_NAME): _TEXT_SELECTOR,
                 vol.Required(
                     CONF_STRATEGY, default=DEFAULT_STRATEGY
-                ): _strategy_selector(),
+                ): _STRATEGY_SELECTOR,
             }
         )
 
@@ -198,36 +459,12 @@ class PowerSaverConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Step 2a: Lowest Price settings."""
         if user_input is not None:
-            self._user_input.update(user_input)
+            self._user_input |= user_input
             return await self.async_step_common_options()
 
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_HOURS_PER_PERIOD, default=DEFAULT_HOURS_PER_PERIOD
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0, max=24, step=0.25, mode=NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Required(
-                    CONF_PERIOD_FROM, default=DEFAULT_PERIOD_FROM
-                ): TimeSelector(),
-                vol.Required(
-                    CONF_PERIOD_TO, default=DEFAULT_PERIOD_TO
-                ): TimeSelector(),
-                vol.Optional(CONF_MIN_CONSECUTIVE_HOURS): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0.25, max=24, step=0.25, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="hours",
-                    )
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="lowest_price",
-            data_schema=schema,
+            data_schema=_LOWEST_PRICE_SCHEMA,
         )
 
     async def async_step_minimum_runtime(
@@ -237,42 +474,14 @@ class PowerSaverConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            if user_input[CONF_ROLLING_WINDOW] < user_input[CONF_MIN_HOURS_ON]:
-                errors["base"] = "rolling_window_too_small"
-            else:
-                self._user_input.update(user_input)
+            errors = _validate_minimum_runtime(user_input)
+            if not errors:
+                self._user_input |= user_input
                 return await self.async_step_common_options()
 
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_MIN_HOURS_ON, default=DEFAULT_MIN_HOURS_ON
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0.25, max=24, step=0.25, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="hours",
-                    )
-                ),
-                vol.Required(
-                    CONF_ROLLING_WINDOW, default=DEFAULT_ROLLING_WINDOW
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=2, max=72, step=0.5, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="hours",
-                    )
-                ),
-                vol.Optional(CONF_MIN_CONSECUTIVE_HOURS): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0.25, max=24, step=0.25, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="hours",
-                    )
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="minimum_runtime",
-            data_schema=schema,
+            data_schema=_MINIMUM_RUNTIME_SCHEMA,
             errors=errors,
         )
 
@@ -292,38 +501,22 @@ class PowerSaverConfigFlow(ConfigFlow, domain=DOMAIN):
                 CONF_SELECTION_MODE: user_input.get(
                     CONF_SELECTION_MODE, DEFAULT_SELECTION_MODE
                 ),
+                # Strategy-specific keys
+                **{key: self._user_input[key] for key in _STRATEGY_OPTION_KEYS[strategy]},
             }
-            # Add strategy-specific keys
-            if strategy == STRATEGY_LOWEST_PRICE:
-                options[CONF_HOURS_PER_PERIOD] = self._user_input[CONF_HOURS_PER_PERIOD]
-                options[CONF_PERIOD_FROM] = self._user_input[CONF_PERIOD_FROM]
-                options[CONF_PERIOD_TO] = self._user_input[CONF_PERIOD_TO]
-                if self._user_input.get(CONF_MIN_CONSECUTIVE_HOURS) is not None:
-                    options[CONF_MIN_CONSECUTIVE_HOURS] = self._user_input[
-                        CONF_MIN_CONSECUTIVE_HOURS
-                    ]
-            else:
-                options[CONF_ROLLING_WINDOW] = self._user_input[CONF_ROLLING_WINDOW]
-                options[CONF_MIN_HOURS_ON] = self._user_input[CONF_MIN_HOURS_ON]
-                if self._user_input.get(CONF_MIN_CONSECUTIVE_HOURS) is not None:
-                    options[CONF_MIN_CONSECUTIVE_HOURS] = self._user_input[
-                        CONF_MIN_CONSECUTIVE_HOURS
-                    ]
+            if (min_consecutive := self._user_input.get(CONF_MIN_CONSECUTIVE_HOURS)) is not None:
+                options[CONF_MIN_CONSECUTIVE_HOURS] = min_consecutive
 
             # Add common optional keys
-            for key in (
-                CONF_ALWAYS_CHEAP,
-                CONF_ALWAYS_EXPENSIVE,
-                CONF_PRICE_SIMILARITY_PCT,
-                CONF_EXCLUDE_FROM,
-                CONF_EXCLUDE_UNTIL,
-            ):
-                if user_input.get(key) is not None:
-                    options[key] = user_input[key]
-            if user_input.get(CONF_CONTROLLED_ENTITIES):
-                options[CONF_CONTROLLED_ENTITIES] = user_input[
-                    CONF_CONTROLLED_ENTITIES
-                ]
+            options.update(
+                {
+                    key: value
+                    for key in _COMMON_OPTIONAL_KEYS
+                    if (value := user_input.get(key)) is not None
+                }
+            )
+            if controlled := user_input.get(CONF_CONTROLLED_ENTITIES):
+                options[CONF_CONTROLLED_ENTITIES] = controlled
 
             return self.async_create_entry(
                 title=self._user_input[CONF_NAME],
@@ -331,56 +524,7 @@ class PowerSaverConfigFlow(ConfigFlow, domain=DOMAIN):
                 options=options,
             )
 
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_SELECTION_MODE, default=DEFAULT_SELECTION_MODE
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[
-                            SelectOptionDict(
-                                value=SELECTION_MODE_CHEAPEST,
-                                label=SELECTION_MODE_CHEAPEST,
-                            ),
-                            SelectOptionDict(
-                                value=SELECTION_MODE_MOST_EXPENSIVE,
-                                label=SELECTION_MODE_MOST_EXPENSIVE,
-                            ),
-                        ],
-                        mode="dropdown",
-                        translation_key=CONF_SELECTION_MODE,
-                    )
-                ),
-                vol.Optional(CONF_ALWAYS_CHEAP): NumberSelector(
-                    NumberSelectorConfig(
-                        min=-10, max=100, step=0.01, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="SEK/kWh",
-                    )
-                ),
-                vol.Optional(CONF_ALWAYS_EXPENSIVE): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0, max=100, step=0.01, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="SEK/kWh",
-                    )
-                ),
-                vol.Optional(CONF_PRICE_SIMILARITY_PCT): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0, max=100, step=1, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="%",
-                    )
-                ),
-                vol.Optional(CONF_EXCLUDE_FROM): TimeSelector(),
-                vol.Optional(CONF_EXCLUDE_UNTIL): TimeSelector(),
-                vol.Optional(
-                    CONF_CONTROLLED_ENTITIES, default=[]
-                ): EntitySelector(
-                    EntitySelectorConfig(
-                        domain=["switch", "input_boolean", "light"],
-                        multiple=True,
-                    )
-                ),
-            }
-        )
+        schema = _common_options_schema({})
 
         return self.async_show_form(
             step_id="common_options",
@@ -388,38 +532,57 @@ class PowerSaverConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
 
-class PowerSaverOptionsFlow(OptionsFlowWithReload):
+class PowerSaverOptionsFlow(_NordPoolSensorsMixin, OptionsFlowWithReload):
     """Handle options flow for Power Saver."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the options flow."""
         super().__init__(*args, **kwargs)
         self._options: dict[str, Any] = {}
+        self._schemas: dict[str, tuple[Mapping[str, Any], vol.Schema]] = {}
+
+    def _options_schema(
+        self, step_id: str, build: Callable[[Mapping[str, Any]], vol.Schema]
+    ) -> vol.Schema:
+        """Return a step schema pre-filled from the entry options.
+
+        The entry options mapping is only replaced when the options are
+        saved, so its identity keys the cache and re-rendering a step
+        (e.g. after a validation error) reuses the already built schema.
+        """
+        options = self.config_entry.options
+        cached = self._schemas.get(step_id)
+        if cached is None or cached[0] is not options:
+            cached = self._schemas[step_id] = (options, build(options))
+        return cached[1]
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Step 1: Strategy + Nord Pool sensor."""
         errors: dict[str, str] = {}
-        defaults = dict(self.config_entry.options)
+        defaults = self.config_entry.options
+        entry_data = self.config_entry.data
+        current_sensor = entry_data.get(CONF_NORDPOOL_SENSOR, "")
 
         if user_input is not None:
             # Handle Nord Pool sensor change (stored in data, not options)
             new_sensor = user_input.pop(CONF_NORDPOOL_SENSOR, None)
-            current_sensor = self.config_entry.data.get(CONF_NORDPOOL_SENSOR)
 
             if new_sensor and new_sensor != current_sensor:
                 new_type = detect_nordpool_type(self.hass, new_sensor)
-                if new_type == "unknown":
+                if new_type not in NORDPOOL_TYPES:
                     _LOGGER.warning(
                         "Selected Nord Pool sensor %s could not be validated",
                         new_sensor,
                     )
                     errors[CONF_NORDPOOL_SENSOR] = "nordpool_not_found"
                 else:
-                    new_data = dict(self.config_entry.data)
-                    new_data[CONF_NORDPOOL_SENSOR] = new_sensor
-                    new_data[CONF_NORDPOOL_TYPE] = new_type
+                    new_data = {
+                        **entry_data,
+                        CONF_NORDPOOL_SENSOR: new_sensor,
+                        CONF_NORDPOOL_TYPE: new_type,
+                    }
                     self.hass.config_entries.async_update_entry(
                         self.config_entry, data=new_data
                     )
@@ -427,24 +590,20 @@ class PowerSaverOptionsFlow(OptionsFlowWithReload):
             if not errors:
                 self._options = dict(user_input)
                 strategy = user_input.get(CONF_STRATEGY, DEFAULT_STRATEGY)
-                if strategy == STRATEGY_MINIMUM_RUNTIME:
-                    return await self.async_step_minimum_runtime()
-                return await self.async_step_lowest_price()
+                return await getattr(self, _STRATEGY_STEPS[strategy])()
 
         # Build sensor selector
-        all_sensors = find_all_nordpool_sensors(self.hass)
-        current_sensor = self.config_entry.data.get(CONF_NORDPOOL_SENSOR, "")
-
-        sensor_options = [
-            SelectOptionDict(value=entity_id, label=label)
-            for entity_id, _, label in all_sensors
-        ]
-
-        current_in_list = any(s[0] == current_sensor for s in all_sensors)
-        if not current_in_list and current_sensor:
-            sensor_options.append(
-                SelectOptionDict(value=current_sensor, label=current_sensor)
-            )
+        all_sensors = self._get_nordpool_sensors()
+        sensor_options = self._get_sensor_options(all_sensors)
+
+        if current_sensor and not any(
+            entity_id == current_sensor for entity_id, _, _ in all_sensors
+        ):
+            # Copy so the cached options are left untouched
+            sensor_options = [
+                *sensor_options,
+                SelectOptionDict(value=current_sensor, label=current_sensor),
+            ]
 
         schema = vol.Schema(
             {
@@ -459,7 +618,7 @@ class PowerSaverOptionsFlow(OptionsFlowWithReload):
                 vol.Required(
                     CONF_STRATEGY,
                     default=defaults.get(CONF_STRATEGY, DEFAULT_STRATEGY),
-                ): _strategy_selector(),
+                ): _STRATEGY_SELECTOR,
             }
         )
 
@@ -473,38 +632,11 @@ class PowerSaverOptionsFlow(OptionsFlowWithReload):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Step 2a: Lowest Price strategy options."""
-        defaults = dict(self.config_entry.options)
-
         if user_input is not None:
-            self._options.update(user_input)
+            self._options |= user_input
             return await self.async_step_common_options()
 
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_HOURS_PER_PERIOD,
-                    default=defaults.get(CONF_HOURS_PER_PERIOD, DEFAULT_HOURS_PER_PERIOD),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0, max=24, step=0.25, mode=NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Required(
-                    CONF_PERIOD_FROM,
-                    default=defaults.get(CONF_PERIOD_FROM, DEFAULT_PERIOD_FROM),
-                ): TimeSelector(),
-                vol.Required(
-                    CONF_PERIOD_TO,
-                    default=defaults.get(CONF_PERIOD_TO, DEFAULT_PERIOD_TO),
-                ): TimeSelector(),
-                _optional_number(CONF_MIN_CONSECUTIVE_HOURS, defaults): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0.25, max=24, step=0.25, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="hours",
-                    )
-                ),
-            }
-        )
+        schema = self._options_schema("lowest_price", _lowest_price_schema)
 
         return self.async_show_form(
             step_id="lowest_price",
@@ -515,44 +647,15 @@ class PowerSaverOptionsFlow(OptionsFlowWithReload):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Step 2b: Minimum Runtime strategy options."""
-        defaults = dict(self.config_entry.options)
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            if user_input[CONF_ROLLING_WINDOW] < user_input[CONF_MIN_HOURS_ON]:
-                errors["base"] = "rolling_window_too_small"
-            else:
-                self._options.update(user_input)
+            errors = _validate_minimum_runtime(user_input)
+            if not errors:
+                self._options |= user_input
                 return await self.async_step_common_options()
 
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_MIN_HOURS_ON,
-                    default=defaults.get(CONF_MIN_HOURS_ON, DEFAULT_MIN_HOURS_ON),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0.25, max=24, step=0.25, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="hours",
-                    )
-                ),
-                vol.Required(
-                    CONF_ROLLING_WINDOW,
-                    default=defaults.get(CONF_ROLLING_WINDOW, DEFAULT_ROLLING_WINDOW),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=2, max=72, step=0.5, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="hours",
-                    )
-                ),
-                _optional_number(CONF_MIN_CONSECUTIVE_HOURS, defaults): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0.25, max=24, step=0.25, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="hours",
-                    )
-                ),
-            }
-        )
+        schema = self._options_schema("minimum_runtime", _minimum_runtime_schema)
 
         return self.async_show_form(
             step_id="minimum_runtime",
@@ -564,66 +667,25 @@ class PowerSaverOptionsFlow(OptionsFlowWithReload):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Step 3: Common options (mode, thresholds, exclusion, entities)."""
-        defaults = dict(self.config_entry.options)
-
         if user_input is not None:
-            self._options.update(user_input)
+            self._options |= user_input
             return self.async_create_entry(data=self._options)
 
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_SELECTION_MODE,
-                    default=defaults.get(CONF_SELECTION_MODE, DEFAULT_SELECTION_MODE),
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[
-                            SelectOptionDict(
-                                value=SELECTION_MODE_CHEAPEST,
-                                label=SELECTION_MODE_CHEAPEST,
-                            ),
-                            SelectOptionDict(
-                                value=SELECTION_MODE_MOST_EXPENSIVE,
-                                label=SELECTION_MODE_MOST_EXPENSIVE,
-                            ),
-                        ],
-                        mode="dropdown",
-                        translation_key=CONF_SELECTION_MODE,
-                    )
-                ),
-                _optional_number(CONF_ALWAYS_CHEAP, defaults): NumberSelector(
-                    NumberSelectorConfig(
-                        min=-10, max=100, step=0.01, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="SEK/kWh",
-                    )
-                ),
-                _optional_number(CONF_ALWAYS_EXPENSIVE, defaults): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0, max=100, step=0.01, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="SEK/kWh",
-                    )
-                ),
-                _optional_number(CONF_PRICE_SIMILARITY_PCT, defaults): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0, max=100, step=1, mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="%",
-                    )
-                ),
-                _optional_time(CONF_EXCLUDE_FROM, defaults): TimeSelector(),
-                _optional_time(CONF_EXCLUDE_UNTIL, defaults): TimeSelector(),
-                vol.Optional(
-                    CONF_CONTROLLED_ENTITIES,
-                    default=defaults.get(CONF_CONTROLLED_ENTITIES, []),
-                ): EntitySelector(
-                    EntitySelectorConfig(
-                        domain=["switch", "input_boolean", "light"],
-                        multiple=True,
-                    )
-                ),
-            }
-        )
+        schema = self._options_schema("common_options", _common_options_schema)
 
         return self.async_show_form(
             step_id="common_options",
             data_schema=schema,
         )
+
+
+if _LEGACY_OPTIONS_FLOW:
+    # Older cores expect the options flow to be handed its config entry
+    _create_options_flow: Callable[[ConfigEntry], PowerSaverOptionsFlow] = (
+        PowerSaverOptionsFlow
+    )
+else:
+
+    def _create_options_flow(_config_entry: ConfigEntry) -> PowerSaverOptionsFlow:
+        """Create the options flow; the core sets its config entry itself."""
+        return PowerSaverOptionsFlow()
@@ -28,6 +28,7 @@ CONF_NAME = "name"
 # Nordpool sensor types
 NORDPOOL_TYPE_HACS = "hacs"
 NORDPOOL_TYPE_NATIVE = "native"
+NORDPOOL_TYPES = frozenset({NORDPOOL_TYPE_HACS, NORDPOOL_TYPE_NATIVE})
 
 # Options keys (changeable via options flow)
 CONF_STRATEGY = "strategy"
@@ -61,14 +62,11 @@ SELECTION_MODE_MOST_EXPENSIVE = "most_expensive"
 DEFAULT_STRATEGY = STRATEGY_LOWEST_PRICE
 DEFAULT_HOURS_PER_PERIOD = 2.5
 DEFAULT_MIN_HOURS_ON = 4.0
-DEFAULT_ALWAYS_CHEAP = None  # None = disabled (field left empty)
-DEFAULT_ALWAYS_EXPENSIVE = None  # None = disabled (field left empty)
-DEFAULT_PRICE_SIMILARITY_PCT = None  # None = disabled (field left empty)
-DEFAULT_MIN_CONSECUTIVE_HOURS = None  # None = disabled (field left empty)
 DEFAULT_SELECTION_MODE = SELECTION_MODE_CHEAPEST
 DEFAULT_PERIOD_FROM = "00:00"
 DEFAULT_PERIOD_TO = "00:00"
 DEFAULT_ROLLING_WINDOW = 28.0
+# Optional thresholds and min consecutive hours have no default: unset = disabled
 
 # Service names
 SERVICE_SET_SCHEDULE_HOURS = "set_schedule_hours"
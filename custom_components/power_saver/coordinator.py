@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import cached_property
 import hashlib
 import json
 import logging
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.event import (
     async_call_later,
     async_track_state_change_event,
@@ -32,6 +37,7 @@ from .const import (
     CONF_MIN_CONSECUTIVE_HOURS,
     CONF_HOURS_PER_PERIOD,
     CONF_MIN_HOURS_ON,
+    CONF_NAME,
     CONF_NORDPOOL_SENSOR,
     CONF_NORDPOOL_TYPE,
     CONF_PERIOD_FROM,
@@ -64,12 +70,21 @@ from .nordpool_adapter import async_get_prices
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_VERSION = 2
+# Minor version 2 stores last_on_time as a Unix timestamp instead of an ISO string
+STORAGE_MINOR_VERSION = 2
 CLOCK_REFRESH_DELAY_SECONDS = 10
 CLOCK_REFRESH_SUPPRESS_SECONDS = CLOCK_REFRESH_DELAY_SECONDS * 2
 CLOCK_REFRESH_MINUTES = tuple(range(0, 60, UPDATE_INTERVAL_MINUTES))
+# Nord Pool publishes today/tomorrow updates in bursts; coalesce them into one.
+# User actions call async_refresh() instead, so they are not delayed.
+REQUEST_REFRESH_COOLDOWN_SECONDS = 1.5
+# Nord Pool sensor attributes the schedule is built from
+NORDPOOL_PRICE_ATTRIBUTES = ("raw_today", "raw_tomorrow")
+# Coordinator states in which the controlled entities are switched on
+_ON_STATES = frozenset({STATE_ACTIVE, STATE_FORCED_ON})
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PowerSaverData:
     """Data returned by the Power Saver coordinator."""
 
@@ -87,6 +102,29 @@ class PowerSaverData:
     emergency_mode: bool = False
 
 
+class _PowerSaverStore(Store[dict[str, Any]]):
+    """Store for the persisted coordinator state."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Migrate persisted state to the current storage format."""
+        if old_major_version == STORAGE_VERSION and old_minor_version < 2:
+            last_on = old_data.get("last_on_time")
+            if isinstance(last_on, str):
+                try:
+                    old_data["last_on_time"] = datetime.fromisoformat(last_on).timestamp()
+                except ValueError:
+                    old_data["last_on_time"] = None
+            return old_data
+        return await super()._async_migrate_func(
+            old_major_version, old_minor_version, old_data
+        )
+
+
 def _is_valid_time(value: object) -> bool:
     """Return whether value is a supported HH:MM or HH:MM:SS time string."""
     is_valid, _error = validate_time_format(value)
@@ -106,10 +144,21 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
             name=f"{DOMAIN}_{entry.entry_id}",
             config_entry=entry,
             update_interval=None,
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN_SECONDS,
+                immediate=False,
+            ),
         )
         self._nordpool_entity = entry.data[CONF_NORDPOOL_SENSOR]
         self._nordpool_type = entry.data.get(CONF_NORDPOOL_TYPE, NORDPOOL_TYPE_HACS)
-        self._store = Store(hass, STORAGE_VERSION, f"power_saver.{entry.entry_id}")
+        self._store = _PowerSaverStore(
+            hass,
+            STORAGE_VERSION,
+            f"power_saver.{entry.entry_id}",
+            minor_version=STORAGE_MINOR_VERSION,
+        )
         self._last_on_time: datetime | None = None
         self._state_loaded = False
         self._refresh_tracking_setup = False
@@ -124,9 +173,23 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
         self._locked_schedule: list[dict] | None = None
         self._schedule_has_tomorrow: bool = False
         self._options_fingerprint: str | None = None
+        self._tomorrow_checked: tuple[list[dict], int] | None = None
         self._hours_override: float | None = None
         self._exclude_from_override: str | None = None
         self._exclude_until_override: str | None = None
+        self._last_saved_state: dict[str, Any] | None = None
+        self._save_task: asyncio.Task[None] | None = None
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by all entities of this entry."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.config_entry.entry_id)},
+            name=self.config_entry.data[CONF_NAME],
+            manufacturer="Power Saver",
+            model="Price Optimizer",
+            entry_type="service",
+        )
 
     @property
     def last_on_time(self) -> datetime | None:
@@ -166,7 +229,7 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
         self._locked_schedule = None  # Force schedule recomputation
         _LOGGER.info("Schedule hours override set to %s", hours)
         await self._async_save_state()
-        await self.async_request_refresh()
+        await self.async_refresh()
 
     async def async_clear_hours_override(self) -> None:
         """Clear the runtime hours override, reverting to config entry value."""
@@ -174,7 +237,7 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
         self._locked_schedule = None  # Force schedule recomputation
         _LOGGER.info("Schedule hours override cleared")
         await self._async_save_state()
-        await self.async_request_refresh()
+        await self.async_refresh()
 
     async def async_set_exclude_times_override(
         self, exclude_from: str, exclude_until: str
@@ -189,7 +252,7 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
             exclude_until,
         )
         await self._async_save_state()
-        await self.async_request_refresh()
+        await self.async_refresh()
 
     async def async_clear_exclude_times_override(self) -> None:
         """Clear the runtime exclude times override, reverting to config values."""
@@ -198,7 +261,7 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
         self._locked_schedule = None  # Force schedule recomputation
         _LOGGER.info("Exclude times override cleared")
         await self._async_save_state()
-        await self.async_request_refresh()
+        await self.async_refresh()
 
     async def async_set_force_on(self, active: bool) -> None:
         """Set or clear the Always on state."""
@@ -208,7 +271,7 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
             await self._control_entities(STATE_ACTIVE)
         else:
             self._previous_state = None  # Force re-evaluation on next update
-        await self.async_request_refresh()
+        await self.async_refresh()
 
     async def async_set_force_off(self, active: bool) -> None:
         """Set or clear the Always off state."""
@@ -218,12 +281,19 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
             await self._control_entities(STATE_STANDBY)
         else:
             self._previous_state = None  # Force re-evaluation on next update
-        await self.async_request_refresh()
+        await self.async_refresh()
 
     async def _async_setup(self) -> None:
         """Set up the coordinator (called once on first refresh)."""
+        await self._async_load_state_once()
         self.async_setup_refresh_tracking()
 
+    async def _async_load_state_once(self) -> None:
+        """Load persisted state unless it has already been loaded."""
+        if not self._state_loaded:
+            await self._async_load_state()
+            self._state_loaded = True
+
     @callback
     def async_setup_refresh_tracking(self) -> None:
         """Set up event-driven and clock-aligned refresh tracking."""
@@ -280,7 +350,20 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
         """Refresh after the quarter-hour boundary grace period."""
         self._unsub_delayed_clock_refresh = None
         _LOGGER.debug("Clock-aligned refresh boundary reached, requesting refresh")
-        self.hass.async_create_task(self.async_request_refresh())
+        self._async_request_refresh_in_background(debounce=False)
+
+    @callback
+    def _async_request_refresh_in_background(self, *, debounce: bool = True) -> None:
+        """Request a refresh from a callback without tracking it as a task.
+
+        Tracked tasks are awaited by Home Assistant during startup and
+        shutdown; a background refresh has no reason to hold either up.
+        Nord Pool bursts are debounced; the clock-aligned refresh is not.
+        """
+        self.hass.async_create_background_task(
+            self.async_request_refresh() if debounce else self.async_refresh(),
+            name=f"{DOMAIN}_{self.config_entry.entry_id}_refresh",
+        )
 
     def _recent_nordpool_refresh_request(self) -> bool:
         """Return whether Nord Pool recently requested a refresh."""
@@ -301,11 +384,24 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
             _LOGGER.debug("Cancelled pending clock-aligned fallback refresh")
 
         _LOGGER.debug("%s updated, requesting refresh", source)
-        self.hass.async_create_task(self.async_request_refresh())
+        self._async_request_refresh_in_background()
 
     @callback
     def _on_nordpool_update(self, event: Event) -> None:
         """Handle Nord Pool sensor state change."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if (
+            old_state is not None
+            and new_state is not None
+            and new_state.state == old_state.state
+            and all(
+                new_state.attributes.get(attr) == old_state.attributes.get(attr)
+                for attr in NORDPOOL_PRICE_ATTRIBUTES
+            )
+        ):
+            _LOGGER.debug("Nord Pool sensor updated without price changes, skipping refresh")
+            return
         self._request_refresh_from_nordpool("Nord Pool sensor")
 
     def _subscribe_native_coordinator(self) -> None:
@@ -402,24 +498,42 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
             _LOGGER.info("Tomorrow prices now available, recomputing schedule")
             return True
 
+        try:
+            last_slot_time = scheduler._slot_start_in(
+                self._locked_schedule[-1], now.tzinfo
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Malformed last slot in locked schedule, recomputing: %s", exc
+            )
+            return True
+
         if raw_tomorrow:
             # Check if raw_tomorrow contains data beyond the schedule's last slot.
             # This happens after midnight when "tomorrow" (new day+1) prices arrive
             # but the locked schedule only covers today+yesterday's-tomorrow.
+            # Nord Pool publishes once a day, so skip the scan when the same
+            # tomorrow slots were already checked against this locked schedule.
             try:
-                last_slot_time = datetime.fromisoformat(
-                    self._locked_schedule[-1]["time"]
-                ).astimezone(now.tzinfo)
-                last_tomorrow_time = max(
-                    scheduler._to_datetime(s.get("start")).astimezone(now.tzinfo)
-                    for s in raw_tomorrow
-                )
-                if last_tomorrow_time > last_slot_time:
-                    _LOGGER.info(
-                        "Tomorrow prices extend beyond locked schedule, recomputing"
+                tomorrow_key = hash(tuple(s.get("start") for s in raw_tomorrow))
+                checked = self._tomorrow_checked
+                if (
+                    checked is None
+                    or checked[0] is not self._locked_schedule
+                    or checked[1] != tomorrow_key
+                ):
+                    last_tomorrow_time = max(
+                        scheduler._to_datetime(s.get("start")).astimezone(now.tzinfo)
+                        for s in raw_tomorrow
                     )
-                    return True
-            except Exception as exc:
+                    if last_tomorrow_time > last_slot_time:
+                        _LOGGER.info(
+                            "Tomorrow prices extend beyond locked schedule, recomputing"
+                        )
+                        return True
+                    self._tomorrow_checked = (self._locked_schedule, tomorrow_key)
+            except (AttributeError, TypeError, ValueError) as exc:
+                # Malformed or missing start times in the tomorrow slots
                 _LOGGER.warning(
                     "Failed to check if tomorrow prices extend beyond schedule, "
                     "recomputing to be safe: %s",
@@ -428,16 +542,6 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
                 return True
 
         # Check if the schedule has expired (all slots in the past)
-        try:
-            last_slot_time = datetime.fromisoformat(
-                self._locked_schedule[-1]["time"]
-            ).astimezone(now.tzinfo)
-        except (KeyError, TypeError, ValueError) as exc:
-            _LOGGER.warning(
-                "Malformed last slot in locked schedule, recomputing: %s", exc
-            )
-            return True
-
         if now > last_slot_time + timedelta(minutes=15):
             _LOGGER.info("Locked schedule expired (all slots in past), recomputing")
             return True
@@ -460,13 +564,16 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
             )
 
         raw_today, raw_tomorrow = await async_get_prices(
-            self.hass, self._nordpool_entity, self._nordpool_type
+            self.hass,
+            self._nordpool_entity,
+            self._nordpool_type,
+            nordpool_state,
+            now.date(),
         )
 
-        # Load persisted state on first run
-        if not self._state_loaded:
-            await self._async_load_state()
-            self._state_loaded = True
+        # Persisted state is loaded in _async_setup; cores without that hook
+        # load it on the first refresh instead
+        await self._async_load_state_once()
 
         # Read options
         options = self.config_entry.options
@@ -513,17 +620,19 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
             else:
                 current_state = STATE_ACTIVE
 
-            emergency_schedule = []
-            for i in range(96):  # 24 hours * 4 slots per hour
-                slot_time = now + timedelta(minutes=i * 15)
-                slot_time = slot_time.replace(
-                    minute=(slot_time.minute // 15) * 15, second=0, microsecond=0
-                )
-                emergency_schedule.append({
+            # Slots are quarter-hour aligned, so floor now once and step from it
+            slot_start = now.replace(
+                minute=(now.minute // 15) * 15, second=0, microsecond=0
+            )
+            slot_length = timedelta(minutes=15)
+            emergency_schedule = [
+                {
                     "price": 0.0,
-                    "time": slot_time.isoformat(),
+                    "time": (slot_start + slot_length * i).isoformat(),
                     "status": STATE_ACTIVE,
-                })
+                }
+                for i in range(96)  # 24 hours * 4 slots per hour
+            ]
 
             return PowerSaverData(
                 schedule=emergency_schedule,
@@ -565,7 +674,7 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
             self._locked_schedule = schedule
             self._schedule_has_tomorrow = bool(raw_tomorrow)
             self._options_fingerprint = self._compute_options_fingerprint()
-            await self._async_save_state()
+            self._async_save_state_in_background()
             _LOGGER.info(
                 "Schedule computed and locked (has_tomorrow=%s, slots=%d)",
                 self._schedule_has_tomorrow, len(schedule),
@@ -587,10 +696,21 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
         next_active = scheduler.find_next_active(schedule, current_slot, now)
         next_inactive = scheduler.find_next_inactive(schedule, current_slot, now)
 
-        # Calculate min/max price from today
-        today_prices = [s.get("value") for s in raw_today if s.get("value") is not None]
-        min_price = round(min(today_prices), 3) if today_prices else None
-        max_price = round(max(today_prices), 3) if today_prices else None
+        # Calculate min/max price from today in a single pass
+        min_price = max_price = None
+        for slot in raw_today:
+            value = slot.get("value")
+            if value is None:
+                continue
+            if min_price is None:
+                min_price = max_price = value
+            elif value < min_price:
+                min_price = value
+            elif value > max_price:
+                max_price = value
+        if min_price is not None:
+            min_price = round(min_price, 3)
+            max_price = round(max_price, 3)
 
         # Update last_on_time for Minimum Runtime strategy
         if strategy == STRATEGY_MINIMUM_RUNTIME and current_state == STATE_ACTIVE:
@@ -602,7 +722,7 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
             and self._previous_state == STATE_ACTIVE
             and current_state != STATE_ACTIVE
         ):
-            await self._async_save_state()
+            self._async_save_state_in_background()
 
         # Compute active hours in period
         active_slots = sum(1 for s in schedule if s.get("status") == STATE_ACTIVE)
@@ -647,20 +767,34 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
         if not entities:
             return
 
-        service = SERVICE_TURN_ON if new_state in (STATE_ACTIVE, STATE_FORCED_ON) else SERVICE_TURN_OFF
+        service = SERVICE_TURN_ON if new_state in _ON_STATES else SERVICE_TURN_OFF
         _LOGGER.info(
-            "State changed to %s, calling homeassistant.%s for %s",
+            "State changed to %s, calling %s for %s",
             new_state, service, entities,
         )
 
-        try:
-            await self.hass.services.async_call(
-                "homeassistant",
-                service,
-                {"entity_id": entities},
-            )
-        except Exception:
-            _LOGGER.exception("Failed to control entities %s", entities)
+        # Call each domain's own service directly instead of letting
+        # homeassistant.turn_on/off dispatch entity by entity
+        by_domain: dict[str, list[str]] = {}
+        for entity_id in entities:
+            by_domain.setdefault(entity_id.partition(".")[0], []).append(entity_id)
+
+        results = await asyncio.gather(
+            *(
+                self.hass.services.async_call(
+                    domain, service, {"entity_id": domain_entities}
+                )
+                for domain, domain_entities in by_domain.items()
+            ),
+            return_exceptions=True,
+        )
+        for domain_entities, result in zip(by_domain.values(), results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Failed to control entities %s",
+                    domain_entities,
+                    exc_info=result,
+                )
 
     async def _async_load_state(self) -> None:
         """Load persisted state from storage."""
@@ -671,14 +805,15 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
                 return
             # The schedule is always recomputed on startup using current prices.
             # Only last_on_time is restored (needed by Minimum Runtime).
-            last_on_iso = data.get("last_on_time")
-            if last_on_iso:
+            # Saved as a Unix timestamp; older files are migrated by the store
+            last_on = data.get("last_on_time")
+            if last_on:
                 try:
-                    self._last_on_time = datetime.fromisoformat(last_on_iso)
+                    self._last_on_time = dt_util.utc_from_timestamp(last_on)
                     _LOGGER.info(
-                        "Restored last_on_time: %s", last_on_iso,
+                        "Restored last_on_time: %s", self._last_on_time,
                     )
-                except (ValueError, TypeError):
+                except (ValueError, TypeError, OverflowError, OSError):
                     self._last_on_time = None
             hours_override = data.get("hours_override")
             if hours_override is not None:
@@ -718,29 +853,43 @@ class PowerSaverCoordinator(DataUpdateCoordinator[PowerSaverData]):
             _LOGGER.exception("Failed to load state from storage")
 
     async def _async_save_state(self) -> None:
-        """Save state to persistent storage."""
+        """Save state to persistent storage if it changed since the last save."""
+        state = {
+            "last_on_time": (
+                self._last_on_time.timestamp()
+                if self._last_on_time
+                else None
+            ),
+            "hours_override": self._hours_override,
+            "exclude_from_override": getattr(
+                self, "_exclude_from_override", None
+            ),
+            "exclude_until_override": getattr(
+                self, "_exclude_until_override", None
+            ),
+        }
+        if state == getattr(self, "_last_saved_state", None):
+            return
         try:
-            await self._store.async_save(
-                {
-                    "last_on_time": (
-                        self._last_on_time.isoformat()
-                        if self._last_on_time
-                        else None
-                    ),
-                    "hours_override": self._hours_override,
-                    "exclude_from_override": getattr(
-                        self, "_exclude_from_override", None
-                    ),
-                    "exclude_until_override": getattr(
-                        self, "_exclude_until_override", None
-                    ),
-                }
-            )
+            await self._store.async_save(state)
         except Exception:
             _LOGGER.exception("Failed to save state to storage")
+        else:
+            self._last_saved_state = state
+
+    @callback
+    def _async_save_state_in_background(self) -> None:
+        """Persist state without holding up the refresh that changed it."""
+        self._save_task = self.hass.async_create_background_task(
+            self._async_save_state(),
+            name=f"{DOMAIN}_{self.config_entry.entry_id}_save_state",
+        )
 
     async def async_shutdown(self) -> None:
         """Clean up listeners and persist state."""
+        if self._save_task is not None and not self._save_task.done():
+            await self._save_task
+        self._save_task = None
         await self._async_save_state()
         self._refresh_tracking_setup = False
         if self._unsub_nordpool:
@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import date, datetime, timedelta
+from collections.abc import Iterator
+from datetime import date, datetime, time, timedelta
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
 
-from .const import NORDPOOL_TYPE_HACS, NORDPOOL_TYPE_NATIVE
+from .const import DOMAIN, NORDPOOL_TYPE_HACS, NORDPOOL_TYPE_NATIVE
 
 _LOGGER = logging.getLogger(__name__)
 
+_ONE_HOUR = timedelta(hours=1)
+# Native sensor keys (unique_id "{area}-{key}") offered as price sources
+_NATIVE_MAIN_KEYS = frozenset({"current_price"})
+# hass.data key for prices fetched via the native service, keyed by
+# (config entry id, areas, currency, date)
+NATIVE_PRICE_CACHE = f"{DOMAIN}_native_prices"
+# Nord Pool publishes day-ahead prices shortly before 13:00 CET; nothing is
+# available for the next day before noon
+NORDPOOL_TIME_ZONE = dt_util.get_time_zone("Europe/Stockholm")
+TOMORROW_PUBLISH_HOUR = 12
+
 
 def detect_nordpool_type(hass: HomeAssistant, entity_id: str) -> str:
     """Detect whether an entity is a HACS Nord Pool or native HA Nord Pool sensor.
@@ -21,9 +34,11 @@ def detect_nordpool_type(hass: HomeAssistant, entity_id: str) -> str:
     Returns:
         "hacs", "native", or "unknown".
     """
-    state = hass.states.get(entity_id)
-    if state is not None and state.attributes.get("raw_today") is not None:
-        return NORDPOOL_TYPE_HACS
+    try:
+        if hass.states.get(entity_id).attributes["raw_today"] is not None:
+            return NORDPOOL_TYPE_HACS
+    except (AttributeError, KeyError):
+        pass
 
     registry = er.async_get(hass)
     entity_entry = registry.async_get(entity_id)
@@ -33,42 +48,39 @@ def detect_nordpool_type(hass: HomeAssistant, entity_id: str) -> str:
     return "unknown"
 
 
-def _get_friendly_name(hass: HomeAssistant, entity_id: str) -> str:
+def _friendly_name_from_state(state: State | None, entity_id: str) -> str:
     """Get the friendly name for an entity, falling back to entity_id."""
-    state = hass.states.get(entity_id)
     if state is not None:
         return state.attributes.get("friendly_name", entity_id)
     return entity_id
 
 
-def find_all_nordpool_sensors(
+def _iter_nordpool_sensors(
     hass: HomeAssistant,
-) -> list[tuple[str, str, str]]:
-    """Find all available Nord Pool sensors (HACS and native).
+) -> Iterator[tuple[str, str, str]]:
+    """Yield available Nord Pool sensors (HACS first, then native).
 
-    For native Nord Pool, only returns the main "current price" sensor per
-    config entry (filters out diagnostic/statistical sensors).
-
-    Returns:
-        List of (entity_id, nordpool_type, label) tuples.
+    Lazy so callers that only need the first match stop scanning early.
     """
     registry = er.async_get(hass)
-    found: list[tuple[str, str, str]] = []
     seen_entity_ids: set[str] = set()
 
-    # Check for HACS Nord Pool: nordpool platform sensor with raw_today attribute
-    for entity_entry in registry.entities.values():
-        if entity_entry.domain != "sensor" or entity_entry.platform != "nordpool":
+    # Check for HACS Nord Pool: nordpool platform sensor with raw_today attribute.
+    # The state machine indexes states by domain, so walk only the sensors
+    # rather than every entity in the registry.
+    for state in hass.states.async_all("sensor"):
+        if state.attributes.get("raw_today") is None:
+            continue
+        entity_entry = registry.async_get(state.entity_id)
+        if entity_entry is None or entity_entry.platform != "nordpool":
             continue
-        state = hass.states.get(entity_entry.entity_id)
-        if state is not None and state.attributes.get("raw_today") is not None:
-            label = _get_friendly_name(hass, entity_entry.entity_id)
-            _LOGGER.debug("Found HACS Nord Pool sensor: %s", entity_entry.entity_id)
-            found.append((entity_entry.entity_id, NORDPOOL_TYPE_HACS, label))
-            seen_entity_ids.add(entity_entry.entity_id)
+        label = _friendly_name_from_state(state, entity_entry.entity_id)
+        _LOGGER.debug("Found HACS Nord Pool sensor: %s", entity_entry.entity_id)
+        seen_entity_ids.add(entity_entry.entity_id)
+        yield entity_entry.entity_id, NORDPOOL_TYPE_HACS, label
 
     # Check for native Nord Pool: all config entries with domain "nordpool"
-    # Native unique_id format: "{area}-{key}" — only include "current_price" sensors
+    # Only include the main price sensors, not diagnostic/statistical ones
     for config_entry in hass.config_entries.async_entries("nordpool"):
         entity_entries = er.async_entries_for_config_entry(
             registry, config_entry.entry_id
@@ -78,17 +90,31 @@ def find_all_nordpool_sensors(
                 entity_entry.domain == "sensor"
                 and entity_entry.entity_id not in seen_entity_ids
                 and entity_entry.unique_id is not None
-                and entity_entry.unique_id.endswith("-current_price")
+                and entity_entry.unique_id.rpartition("-")[2] in _NATIVE_MAIN_KEYS
             ):
-                label = _get_friendly_name(hass, entity_entry.entity_id)
+                label = _friendly_name_from_state(
+                    hass.states.get(entity_entry.entity_id), entity_entry.entity_id
+                )
                 _LOGGER.debug(
                     "Found native Nord Pool sensor: %s",
                     entity_entry.entity_id,
                 )
-                found.append((entity_entry.entity_id, NORDPOOL_TYPE_NATIVE, label))
                 seen_entity_ids.add(entity_entry.entity_id)
+                yield entity_entry.entity_id, NORDPOOL_TYPE_NATIVE, label
+
+
+def find_all_nordpool_sensors(
+    hass: HomeAssistant,
+) -> list[tuple[str, str, str]]:
+    """Find all available Nord Pool sensors (HACS and native).
+
+    For native Nord Pool, only returns the main "current price" sensor per
+    config entry (filters out diagnostic/statistical sensors).
 
-    return found
+    Returns:
+        List of (entity_id, nordpool_type, label) tuples.
+    """
+    return list(_iter_nordpool_sensors(hass))
 
 
 def auto_detect_nordpool(
@@ -102,9 +128,7 @@ def auto_detect_nordpool(
     Returns:
         Tuple of (entity_id, nordpool_type) or (None, None) if not found.
     """
-    sensors = find_all_nordpool_sensors(hass)
-    if sensors:
-        entity_id, nordpool_type, _label = sensors[0]
+    for entity_id, nordpool_type, _label in _iter_nordpool_sensors(hass):
         return entity_id, nordpool_type
     return None, None
 
@@ -113,6 +137,8 @@ async def async_get_prices(
     hass: HomeAssistant,
     entity_id: str,
     nordpool_type: str,
+    state: State | None = None,
+    today: date | None = None,
 ) -> tuple[list[dict], list[dict]]:
     """Fetch today's and tomorrow's prices, normalized to [{start, end, value}].
 
@@ -120,24 +146,25 @@ async def async_get_prices(
         hass: Home Assistant instance.
         entity_id: The Nord Pool sensor entity ID.
         nordpool_type: "hacs" or "native".
+        state: The sensor state if the caller already read it.
+        today: The local date of the refresh if the caller already has it.
 
     Returns:
         Tuple of (raw_today, raw_tomorrow) in HACS-compatible format.
     """
     if nordpool_type == NORDPOOL_TYPE_HACS:
-        return _get_hacs_prices(hass, entity_id)
+        if state is None:
+            state = hass.states.get(entity_id)
+        return _get_hacs_prices(state)
     if nordpool_type == NORDPOOL_TYPE_NATIVE:
-        return await _async_get_native_prices(hass, entity_id)
+        return await _async_get_native_prices(hass, entity_id, today)
 
     _LOGGER.error("Unknown nordpool_type: %s", nordpool_type)
     return [], []
 
 
-def _get_hacs_prices(
-    hass: HomeAssistant, entity_id: str
-) -> tuple[list[dict], list[dict]]:
+def _get_hacs_prices(state: State | None) -> tuple[list[dict], list[dict]]:
     """Read prices from HACS Nord Pool sensor attributes."""
-    state = hass.states.get(entity_id)
     if state is None:
         return [], []
 
@@ -147,7 +174,7 @@ def _get_hacs_prices(
 
 
 async def _async_get_native_prices(
-    hass: HomeAssistant, entity_id: str
+    hass: HomeAssistant, entity_id: str, today: date | None = None
 ) -> tuple[list[dict], list[dict]]:
     """Fetch prices from native HA Nord Pool.
 
@@ -164,6 +191,8 @@ async def _async_get_native_prices(
         return [], []
 
     config_entry_id = entity_entry.config_entry_id
+    if today is None:
+        today = dt_util.now().date()
 
     # Primary: read directly from native coordinator's cached data.
     # The native coordinator fetches yesterday+today+tomorrow in a single
@@ -173,7 +202,7 @@ async def _async_get_native_prices(
     # future dates reliably.
     config_entry = hass.config_entries.async_get_entry(config_entry_id)
     if config_entry is not None:
-        result = _get_native_coordinator_prices(config_entry)
+        result = _get_native_coordinator_prices(config_entry, today)
         if result is not None:
             raw_today, raw_tomorrow = result
             _LOGGER.debug(
@@ -185,17 +214,50 @@ async def _async_get_native_prices(
 
     # Fallback: individual service calls
     _LOGGER.debug("Falling back to service calls for native Nord Pool prices")
-    today = dt_util.now().date()
-    tomorrow = today + timedelta(days=1)
-
-    raw_today = await _async_fetch_native_date(hass, config_entry_id, today)
-    raw_tomorrow = await _async_fetch_native_date(hass, config_entry_id, tomorrow)
+    target_dates = [today]
+    # Tomorrow's prices cannot exist before the day-ahead auction results are
+    # published, so don't ask for them earlier
+    if _next_day_published(today):
+        target_dates.append(today + timedelta(days=1))
+
+    cache = hass.data.setdefault(NATIVE_PRICE_CACHE, {})
+    for stale_key in [key for key in cache if key[-1] < today]:
+        del cache[stale_key]
+
+    # The dates are independent, so fetch them concurrently. Eager tasks run
+    # inline until the first suspension, so an answer the service can give
+    # without waiting costs no extra event loop iteration.
+    results = await asyncio.gather(
+        *(
+            hass.async_create_task(
+                _async_fetch_native_date(hass, config_entry_id, target_date),
+                f"nordpool_prices_{target_date}",
+                eager_start=True,
+            )
+            for target_date in target_dates
+        )
+    )
+    raw_today = results[0]
+    raw_tomorrow = results[1] if len(results) > 1 else []
 
     return raw_today, raw_tomorrow
 
 
+def _next_day_published(today: date) -> bool:
+    """Return whether Nord Pool has published prices for the day after today.
+
+    Day-ahead prices are published at noon Stockholm time on the previous
+    day, which may fall on a different local date than HA's own time zone.
+    """
+    publish_time = datetime.combine(
+        today, time(TOMORROW_PUBLISH_HOUR), tzinfo=NORDPOOL_TIME_ZONE
+    )
+    return dt_util.now() >= publish_time
+
+
 def _get_native_coordinator_prices(
     config_entry,
+    today: date | None = None,
 ) -> tuple[list[dict], list[dict]] | None:
     """Read prices directly from the native Nord Pool coordinator's cached data.
 
@@ -224,9 +286,10 @@ def _get_native_coordinator_prices(
         return None
     area = areas[0]
 
-    now = dt_util.now()
-    today_str = now.strftime("%Y-%m-%d")
-    tomorrow_str = (now + timedelta(days=1)).strftime("%Y-%m-%d")
+    if today is None:
+        today = dt_util.now().date()
+    today_str = today.isoformat()
+    tomorrow_str = (today + timedelta(days=1)).isoformat()
 
     today_prices: list[dict] = []
     tomorrow_prices: list[dict] = []
@@ -273,7 +336,25 @@ def _get_native_coordinator_prices(
 async def _async_fetch_native_date(
     hass: HomeAssistant, config_entry_id: str, target_date: date
 ) -> list[dict]:
-    """Call nordpool.get_prices_for_date and convert to standard format."""
+    """Call nordpool.get_prices_for_date and convert to standard format.
+
+    Published day-ahead prices do not change, so a non-empty result is kept
+    for the rest of its day. Empty results (tomorrow not published yet) are
+    not cached. The key includes the entry's areas and currency, which can be
+    changed without changing the entry id.
+    """
+    cache: dict[tuple, list[dict]] = hass.data.setdefault(NATIVE_PRICE_CACHE, {})
+    config_entry = hass.config_entries.async_get_entry(config_entry_id)
+    entry_data = config_entry.data if config_entry is not None else {}
+    cache_key = (
+        config_entry_id,
+        tuple(entry_data.get("areas", ())),
+        entry_data.get("currency"),
+        target_date,
+    )
+    if (cached := cache.get(cache_key)) is not None:
+        return cached
+
     try:
         response = await hass.services.async_call(
             "nordpool",
@@ -296,7 +377,17 @@ async def _async_fetch_native_date(
     if not response:
         return []
 
-    return _convert_native_response(response)
+    prices = _convert_native_response(response)
+    if prices:
+        cache[cache_key] = prices
+    return prices
+
+
+def _one_hour_after(start: str | datetime) -> str | datetime:
+    """Return the end of a 1-hour slot, as the same type as its start."""
+    if isinstance(start, datetime):
+        return start + _ONE_HOUR
+    return (datetime.fromisoformat(start) + _ONE_HOUR).isoformat()
 
 
 def _convert_native_response(response: dict | list) -> list[dict]:
@@ -324,10 +415,9 @@ def _convert_native_response(response: dict | list) -> list[dict]:
     converted: list[dict] = []
     for entry in price_list:
         try:
-            start = entry.get("start")
-            end = entry.get("end")
+            start = entry["start"]
             # Native uses "price" in Currency/MWh
-            price_mwh = entry.get("price")
+            price_mwh = entry["price"]
 
             if start is None or price_mwh is None:
                 continue
@@ -336,21 +426,18 @@ def _convert_native_response(response: dict | list) -> list[dict]:
             price_kwh = float(price_mwh) / 1000.0
 
             # If no explicit end, assume 1-hour slots
+            end = entry.get("end")
             if end is None:
-                start_dt = (
-                    start
-                    if isinstance(start, datetime)
-                    else datetime.fromisoformat(start)
-                )
-                end_dt = start_dt + timedelta(hours=1)
-                # Preserve the same type as start
-                end = end_dt if isinstance(start, datetime) else end_dt.isoformat()
+                end = _one_hour_after(start)
 
             converted.append({
                 "start": start,
                 "end": end,
                 "value": price_kwh,
             })
+        except KeyError:
+            # Entries without a start or price are skipped, as when they are None
+            continue
         except (ValueError, TypeError) as exc:
             _LOGGER.warning("Error converting native Nord Pool entry: %s", exc)
             continue
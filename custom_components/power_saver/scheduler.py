@@ -9,7 +9,10 @@ It provides two scheduling strategies:
 from __future__ import annotations
 
 import logging
-from datetime import date, datetime, time, timedelta
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta, tzinfo
+from functools import lru_cache
+from itertools import islice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +32,32 @@ def _to_datetime(value: str | datetime) -> datetime:
     return datetime.fromisoformat(value)
 
 
+@lru_cache(maxsize=512)
+def _parse_slot_time(value: str) -> datetime:
+    """Parse a schedule slot timestamp.
+
+    The locked schedule is re-read on every refresh with the same ISO strings,
+    so each timestamp is parsed once rather than on every pass over it.
+    """
+    return datetime.fromisoformat(value)
+
+
+def _slot_start(slot: dict) -> datetime:
+    """Return the start time of a schedule slot."""
+    return _parse_slot_time(slot["time"])
+
+
+@lru_cache(maxsize=512)
+def _parse_slot_time_in(value: str, tz: tzinfo | None) -> datetime:
+    """Parse a schedule slot timestamp and convert it to the given time zone."""
+    return _parse_slot_time(value).astimezone(tz)
+
+
+def _slot_start_in(slot: dict, tz: tzinfo | None) -> datetime:
+    """Return the start time of a schedule slot in the given time zone."""
+    return _parse_slot_time_in(slot["time"], tz)
+
+
 def _compute_similarity_threshold(
     sorted_slots: list[dict],
     price_similarity_pct: float | None,
@@ -129,7 +158,7 @@ def _build_base_schedule(
             })
         except (ValueError, TypeError, KeyError) as e:
             _LOGGER.warning("Error processing slot: %s", e)
-    schedule.sort(key=lambda x: x["time"])
+    schedule.sort(key=_slot_start)
     return schedule
 
 
@@ -236,9 +265,9 @@ def _activate_cheapest_in_group(
     # Sort by price (cheapest first for normal, most expensive first for inverted)
     eligible.sort(key=lambda x: x[1]["price"], reverse=inverted)
 
-    # Compute similarity threshold for this group
-    sorted_for_threshold = [{"value": s["price"]} for _, s in eligible]
-    threshold = _compute_similarity_threshold(sorted_for_threshold, price_similarity_pct, inverted)
+    # Compute similarity threshold for this group (only the anchor price is read)
+    anchor = [{"value": eligible[0][1]["price"]}]
+    threshold = _compute_similarity_threshold(anchor, price_similarity_pct, inverted)
 
     quota = min_slots
     for idx, entry in eligible:
@@ -313,31 +342,35 @@ def _find_consecutive_candidates(
     """
     if end_idx is None:
         end_idx = len(schedule)
-    candidates = []
-    for i in range(max(start_idx, 0), min(end_idx, len(schedule)) - window_size + 1):
-        window = schedule[i:i + window_size]
-
-        # Skip windows containing excluded slots
-        if any(s.get("status") == "excluded" for s in window):
-            continue
+    lo = max(start_idx, 0)
+    hi = min(end_idx, len(schedule))
+
+    # Prefix sums over the range so each window is scored in O(1) rather than
+    # rescanning its slots. Prices carry 3 decimals, so they are summed as
+    # integer thousandths to keep equal-priced windows exactly equal.
+    blocked_prefix = [0]
+    active_prefix = [0]
+    price_prefix = [0]
+    for s in schedule[lo:hi]:
+        price = s.get("price", 0)
+        blocked = s.get("status") == "excluded" or (
+            always_cheap is not None and price <= always_cheap
+            if inverted
+            else always_expensive is not None and price >= always_expensive
+        )
+        blocked_prefix.append(blocked_prefix[-1] + blocked)
+        active_prefix.append(active_prefix[-1] + (s.get("status") == "active"))
+        price_prefix.append(price_prefix[-1] + round(price * 1000))
 
-        # Check price constraints for each slot in the window
-        valid = True
-        for s in window:
-            price = s.get("price", 0)
-            if not inverted and always_expensive is not None and price >= always_expensive:
-                valid = False
-                break
-            if inverted and always_cheap is not None and price <= always_cheap:
-                valid = False
-                break
-        if not valid:
+    candidates = []
+    for offset in range(hi - lo - window_size + 1):
+        end = offset + window_size
+        # Skip windows containing excluded slots or slots outside the price limits
+        if blocked_prefix[end] != blocked_prefix[offset]:
             continue
-
-        active_count = sum(1 for s in window if s.get("status") == "active")
-        new_needed = window_size - active_count
-        total_price = sum(s.get("price", 0) for s in window)
-        candidates.append((i, new_needed, total_price))
+        new_needed = window_size - (active_prefix[end] - active_prefix[offset])
+        total_price = (price_prefix[end] - price_prefix[offset]) / 1000
+        candidates.append((lo + offset, new_needed, total_price))
 
     # Sort: fewest new activations first, then by price
     if inverted:
@@ -379,7 +412,7 @@ def _partition_into_periods(
 
     period_groups: dict[object, list[int]] = {}
     for i, s in enumerate(schedule):
-        slot_time = datetime.fromisoformat(s["time"]).astimezone(now.tzinfo)
+        slot_time = _slot_start_in(s, now.tzinfo)
         slot_tod = slot_time.time()
 
         if cross_midnight:
@@ -431,9 +464,7 @@ def active_hours_in_current_period(
     # Try to find the period whose time span covers `now`
     for indices in periods:
         for i in indices:
-            slot_time = datetime.fromisoformat(schedule[i]["time"]).astimezone(
-                now.tzinfo
-            )
+            slot_time = _slot_start_in(schedule[i], now.tzinfo)
             if slot_time <= now < slot_time + timedelta(minutes=15):
                 active = sum(
                     1
@@ -449,12 +480,8 @@ def active_hours_in_current_period(
     best_future_indices = None
     best_future_start = None
     for indices in periods:
-        first_time = datetime.fromisoformat(
-            schedule[indices[0]]["time"]
-        ).astimezone(now.tzinfo)
-        last_time = datetime.fromisoformat(
-            schedule[indices[-1]]["time"]
-        ).astimezone(now.tzinfo)
+        first_time = _slot_start_in(schedule[indices[0]], now.tzinfo)
+        last_time = _slot_start_in(schedule[indices[-1]], now.tzinfo)
         if last_time <= now:
             if best_past_end is None or last_time > best_past_end:
                 best_past_end = last_time
@@ -684,7 +711,7 @@ def build_lowest_price_schedule(
             )
 
     # Sort by time
-    schedule.sort(key=lambda x: x["time"])
+    schedule.sort(key=_slot_start)
 
     # Apply minimum consecutive hours constraint if enabled
     if min_consecutive_hours is not None and min_consecutive_hours > 0:
@@ -697,7 +724,7 @@ def build_lowest_price_schedule(
             # and allow cross-day slot migration.
             days: dict[date, list[int]] = {}
             for i, slot in enumerate(schedule):
-                slot_date = datetime.fromisoformat(slot["time"]).date()
+                slot_date = _slot_start(slot).date()
                 days.setdefault(slot_date, []).append(i)
             for day_indices in days.values():
                 sub = [schedule[i] for i in day_indices]
@@ -794,14 +821,11 @@ def build_minimum_runtime_schedule(
         last_on_time.isoformat() if last_on_time else "None", inverted,
     )
 
-    # Find the current ongoing slot index (for overdue force-activation)
-    current_slot_idx = len(schedule)
-    for i, s in enumerate(schedule):
-        slot_time = datetime.fromisoformat(s["time"]).astimezone(now.tzinfo)
-        slot_end = slot_time + timedelta(minutes=15)
-        if slot_end > now:  # This slot hasn't ended yet
-            current_slot_idx = i
-            break
+    # Find the current ongoing slot index (for overdue force-activation):
+    # the first slot that hasn't ended yet
+    current_slot_idx = bisect_right(
+        schedule, now - timedelta(minutes=15), key=_slot_start
+    )
 
     # Compute the first deadline (device must be on by this time)
     if last_on_time is None:
@@ -831,13 +855,10 @@ def build_minimum_runtime_schedule(
         # Window extends from search_from until deadline + min_hours_on
         window_end_time = next_deadline + timedelta(hours=min_hours_on)
 
-        # Find window end index
-        window_end_idx = len(schedule)
-        for i in range(search_from, len(schedule)):
-            slot_time = datetime.fromisoformat(schedule[i]["time"]).astimezone(now.tzinfo)
-            if slot_time >= window_end_time:
-                window_end_idx = i
-                break
+        # Find window end index: the first slot starting at or after the window end
+        window_end_idx = bisect_left(
+            schedule, window_end_time, lo=search_from, key=_slot_start
+        )
 
         if search_from >= window_end_idx:
             break  # No slots in this window
@@ -883,9 +904,7 @@ def build_minimum_runtime_schedule(
         for idx, _ in selected:
             schedule[idx]["status"] = "active"
             activated += 1
-            slot_time = datetime.fromisoformat(schedule[idx]["time"]).astimezone(
-                now.tzinfo
-            )
+            slot_time = _slot_start_in(schedule[idx], now.tzinfo)
             if last_activated_time is None or slot_time > last_activated_time:
                 last_activated_time = slot_time
 
@@ -899,9 +918,7 @@ def build_minimum_runtime_schedule(
                 if schedule[i]["status"] != "excluded":
                     schedule[i]["status"] = "active"
                     activated += 1
-                    slot_time = datetime.fromisoformat(
-                        schedule[i]["time"]
-                    ).astimezone(now.tzinfo)
+                    slot_time = _slot_start_in(schedule[i], now.tzinfo)
                     if last_activated_time is None or slot_time > last_activated_time:
                         last_activated_time = slot_time
             if activated == 0:
@@ -915,9 +932,9 @@ def build_minimum_runtime_schedule(
         )
         # Ensure deadline advances past the current window to avoid backward loops
         # when past slots are activated in the locked schedule
-        window_end_slot_time = datetime.fromisoformat(
-            schedule[min(window_end_idx, len(schedule) - 1)]["time"]
-        ).astimezone(now.tzinfo)
+        window_end_slot_time = _slot_start_in(
+            schedule[min(window_end_idx, len(schedule) - 1)], now.tzinfo
+        )
         next_deadline = max(raw_deadline, window_end_slot_time)
         search_from = window_end_idx
 
@@ -925,7 +942,7 @@ def build_minimum_runtime_schedule(
         # That window will be handled when the schedule is recomputed
         # with new price data.
         last_slot_end = (
-            datetime.fromisoformat(schedule[-1]["time"]).astimezone(now.tzinfo)
+            _slot_start_in(schedule[-1], now.tzinfo)
             + timedelta(minutes=15)
         )
         if next_deadline > last_slot_end:
@@ -1060,22 +1077,22 @@ def find_current_slot(schedule: list[dict], now: datetime) -> dict | None:
     Returns:
         The matching slot dict, or None if no slot covers the current time.
     """
-    for i, s in enumerate(schedule):
-        slot_time = datetime.fromisoformat(s["time"]).astimezone(now.tzinfo)
-
-        # Determine slot end time
-        if i + 1 < len(schedule):
-            next_slot_time = datetime.fromisoformat(schedule[i + 1]["time"]).astimezone(now.tzinfo)
-        else:
-            if i > 0:
-                prev_slot_time = datetime.fromisoformat(schedule[i - 1]["time"]).astimezone(now.tzinfo)
-                slot_duration = slot_time - prev_slot_time
-            else:
-                slot_duration = timedelta(minutes=15)
-            next_slot_time = slot_time + slot_duration
-
-        if slot_time <= now < next_slot_time:
-            return s
+    # The schedule is time-sorted, so binary search parses only a few slot times
+    idx = bisect_right(schedule, now, key=_slot_start) - 1
+    if idx < 0:
+        return None
+    if idx + 1 < len(schedule):
+        # bisect guarantees now is before the next slot's start
+        return schedule[idx]
+
+    # Last slot: assume it lasts as long as the gap from the previous one
+    slot_time = _slot_start(schedule[idx])
+    if idx > 0:
+        slot_duration = slot_time - _slot_start(schedule[idx - 1])
+    else:
+        slot_duration = timedelta(minutes=15)
+    if now < slot_time + slot_duration:
+        return schedule[idx]
 
     return None
 
@@ -1099,12 +1116,7 @@ def find_next_change(
         return None
 
     current_state = current_slot.get("status")
-    future_slots = [
-        s for s in schedule
-        if datetime.fromisoformat(s["time"]).astimezone(now.tzinfo) > now
-    ]
-
-    for slot in future_slots:
+    for slot in islice(schedule, bisect_right(schedule, now, key=_slot_start), None):
         if slot.get("status") != current_state:
             return slot["time"]
 
@@ -1124,7 +1136,7 @@ def _find_next_active_boundary(
 
     for slot in schedule:
         try:
-            slot_time = datetime.fromisoformat(slot["time"]).astimezone(now.tzinfo)
+            slot_time = _slot_start_in(slot, now.tzinfo)
         except (KeyError, TypeError, ValueError) as exc:
             _LOGGER.warning(
                 "Skipping malformed schedule entry while finding active boundary: %s (%s)",
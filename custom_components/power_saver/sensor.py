@@ -11,12 +11,11 @@ from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_NAME, DOMAIN, STATE_ACTIVE, STATE_EXCLUDED, STATE_FORCED_OFF, STATE_FORCED_ON, STATE_STANDBY
+from .const import DOMAIN, STATE_ACTIVE, STATE_EXCLUDED, STATE_FORCED_OFF, STATE_FORCED_ON, STATE_STANDBY
 from .coordinator import PowerSaverCoordinator, PowerSaverData
 
 
@@ -55,13 +54,7 @@ class PowerSaverSensor(CoordinatorEntity[PowerSaverCoordinator], SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_status"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=entry.data[CONF_NAME],
-            manufacturer="Power Saver",
-            model="Price Optimizer",
-            entry_type="service",
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> str:
@@ -122,13 +115,7 @@ class _DiagnosticBase(CoordinatorEntity[PowerSaverCoordinator], SensorEntity):
         """Initialize the diagnostic sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_{self._attr_translation_key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=entry.data[CONF_NAME],
-            manufacturer="Power Saver",
-            model="Price Optimizer",
-            entry_type="service",
-        )
+        self._attr_device_info = coordinator.device_info
 
 
 class ScheduleSensor(_DiagnosticBase):
@@ -175,7 +162,9 @@ class LastActiveSensor(_DiagnosticBase):
             return None
         now = datetime.now().astimezone()
         last = None
-        for s in self.coordinator.data.schedule:
+        # The schedule is time-sorted: walk back from the end and stop at the
+        # first active slot that has started
+        for s in reversed(self.coordinator.data.schedule):
             if s.get("status") != "active":
                 continue
             try:
@@ -185,6 +174,7 @@ class LastActiveSensor(_DiagnosticBase):
                 continue
             if slot_time <= now:
                 last = slot_time
+                break
         # Fallback to coordinator's persisted last_on_time (useful for
         # Minimum Runtime where past slots aren't in the schedule)
         persisted = self.coordinator.last_on_time
@@ -8,12 +8,11 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_NAME, DOMAIN
+from .const import DOMAIN
 from .coordinator import PowerSaverCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,13 +47,7 @@ class _ForceSwitch(
         """Initialize the switch."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_{self._attr_translation_key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=entry.data[CONF_NAME],
-            manufacturer="Power Saver",
-            model="Price Optimizer",
-            entry_type="service",
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -46,6 +46,7 @@ from custom_components.power_saver.const import (
     STRATEGY_LOWEST_PRICE,
     STRATEGY_MINIMUM_RUNTIME,
 )
+from custom_components.power_saver.nordpool_adapter import find_all_nordpool_sensors
 
 NORDPOOL_ENTITY = "sensor.nordpool_kwh_se4_sek"
 NORDPOOL_ENTITY_SE3 = "sensor.nordpool_kwh_se3_sek"
@@ -362,6 +363,48 @@ async def test_multiple_sensors_user_selects(
     assert result["data"][CONF_NORDPOOL_TYPE] == NORDPOOL_TYPE_NATIVE
 
 
+async def test_user_step_rerender_reuses_sensor_scan(
+    hass: HomeAssistant, setup_hacs_nordpool
+):
+    """Re-rendering the user step after an error does not rescan the registry."""
+    with patch(
+        "custom_components.power_saver.config_flow.find_all_nordpool_sensors",
+        wraps=find_all_nordpool_sensors,
+    ) as mock_find:
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        with patch(
+            "custom_components.power_saver.config_flow.detect_nordpool_type",
+            return_value="unknown",
+        ):
+            result = await hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                {
+                    CONF_NORDPOOL_SENSOR: NORDPOOL_ENTITY,
+                    CONF_NAME: "Water Heater",
+                    CONF_STRATEGY: STRATEGY_LOWEST_PRICE,
+                },
+            )
+
+        assert result["type"] is FlowResultType.FORM
+        assert result["errors"]["base"] == "nordpool_not_found"
+        assert mock_find.call_count == 1
+
+        # A registry change invalidates the cached scan
+        er.async_get(hass).async_update_entity(NORDPOOL_ENTITY, name="Nord Pool")
+        await hass.async_block_till_done()
+        await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                CONF_NORDPOOL_SENSOR: NORDPOOL_ENTITY,
+                CONF_NAME: "Water Heater",
+                CONF_STRATEGY: STRATEGY_LOWEST_PRICE,
+            },
+        )
+        assert mock_find.call_count == 2
+
+
 # --- Options flow tests (3-step: init → strategy → common_options) ---
 
 
@@ -630,3 +673,69 @@ async def test_options_flow_switch_strategy(hass: HomeAssistant, setup_hacs_nord
     assert config_entry.options[CONF_ROLLING_WINDOW] == 26.0
     assert config_entry.options[CONF_MIN_HOURS_ON] == 2.0
     assert config_entry.options[CONF_SELECTION_MODE] == SELECTION_MODE_MOST_EXPENSIVE
+
+
+# --- Schema caching ---
+
+
+def test_common_options_schema_is_cached_per_defaults():
+    """Re-rendering with the same relevant defaults reuses the built schema."""
+    from custom_components.power_saver.config_flow import _common_options_schema
+
+    defaults = {
+        CONF_STRATEGY: STRATEGY_LOWEST_PRICE,
+        CONF_ALWAYS_CHEAP: 0.05,
+        CONF_CONTROLLED_ENTITIES: ["switch.heater"],
+    }
+    schema = _common_options_schema(defaults)
+
+    # Options the step does not read must not defeat the cache
+    assert _common_options_schema({**defaults, CONF_HOURS_PER_PERIOD: 6.0}) is schema
+    assert _common_options_schema({**defaults, CONF_ALWAYS_CHEAP: 0.1}) is not schema
+    assert schema({})[CONF_CONTROLLED_ENTITIES] == ["switch.heater"]
+
+
+async def test_options_flow_reuses_schema_on_rerender(
+    hass: HomeAssistant, setup_hacs_nordpool
+):
+    """A step re-rendered after a validation error reuses its schema."""
+    config_entry = _make_config_entry(hass, strategy=STRATEGY_MINIMUM_RUNTIME)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_NORDPOOL_SENSOR: NORDPOOL_ENTITY,
+            CONF_STRATEGY: STRATEGY_MINIMUM_RUNTIME,
+        },
+    )
+    assert result["step_id"] == "minimum_runtime"
+    schema = result["data_schema"]
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_ROLLING_WINDOW: 2.0,
+            CONF_MIN_HOURS_ON: 4.0,
+        },
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "rolling_window_too_small"}
+    assert result["data_schema"] is schema
+
+
+def test_strategy_schemas_are_cached_per_defaults():
+    """Options flows opened on unchanged options reuse the strategy schemas."""
+    from custom_components.power_saver.config_flow import (
+        _lowest_price_schema,
+        _minimum_runtime_schema,
+    )
+
+    defaults = {CONF_HOURS_PER_PERIOD: 6.0, CONF_MIN_CONSECUTIVE_HOURS: 2.0}
+    schema = _lowest_price_schema(defaults)
+
+    assert _lowest_price_schema(dict(defaults)) is schema
+    assert _lowest_price_schema({**defaults, CONF_HOURS_PER_PERIOD: 4.0}) is not schema
+    assert schema({})[CONF_HOURS_PER_PERIOD] == 6.0
+    assert _minimum_runtime_schema({}) is _minimum_runtime_schema({CONF_STRATEGY: "x"})
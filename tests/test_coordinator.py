@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import json
 import sys
@@ -24,6 +25,7 @@ NORDPOOL_TYPE_NATIVE = "native"
 EXPECTED_CLOCK_REFRESH_DELAY_SECONDS = 10
 EXPECTED_CLOCK_REFRESH_SUPPRESS_SECONDS = 20
 EXPECTED_CLOCK_REFRESH_MINUTES = (0, 15, 30, 45)
+EXPECTED_REQUEST_REFRESH_COOLDOWN_SECONDS = 1.5
 
 
 def _make_coordinator_for_refresh_tracking(nordpool_type=NORDPOOL_TYPE_HACS):
@@ -31,7 +33,7 @@ def _make_coordinator_for_refresh_tracking(nordpool_type=NORDPOOL_TYPE_HACS):
     from custom_components.power_saver.coordinator import PowerSaverCoordinator
 
     hass = MagicMock()
-    hass.async_create_task = MagicMock()
+    hass.async_create_background_task = MagicMock()
     entry = MagicMock()
     entry.entry_id = "test_123"
     entry.data = {
@@ -42,13 +44,14 @@ def _make_coordinator_for_refresh_tracking(nordpool_type=NORDPOOL_TYPE_HACS):
 
     with (
         patch("custom_components.power_saver.coordinator.DataUpdateCoordinator.__init__"),
-        patch("custom_components.power_saver.coordinator.Store"),
+        patch("custom_components.power_saver.coordinator._PowerSaverStore"),
     ):
         coordinator = PowerSaverCoordinator(hass, entry)
 
     coordinator.hass = hass
     coordinator.config_entry = entry
     coordinator.async_request_refresh = MagicMock()
+    coordinator.async_refresh = MagicMock()
     return coordinator
 
 
@@ -101,12 +104,36 @@ class TestRefreshTracking:
             patch(
                 "custom_components.power_saver.coordinator.DataUpdateCoordinator.__init__"
             ) as mock_init,
-            patch("custom_components.power_saver.coordinator.Store"),
+            patch("custom_components.power_saver.coordinator._PowerSaverStore"),
         ):
             PowerSaverCoordinator(hass, entry)
 
         assert mock_init.call_args.kwargs["update_interval"] is None
 
+    def test_refresh_requests_are_debounced(self):
+        """Bursts of refresh requests should collapse into one delayed refresh."""
+        from custom_components.power_saver.coordinator import PowerSaverCoordinator
+
+        hass = MagicMock()
+        entry = MagicMock()
+        entry.entry_id = "test_123"
+        entry.data = {
+            "nordpool_sensor": "sensor.nordpool",
+            "nordpool_type": NORDPOOL_TYPE_HACS,
+        }
+
+        with (
+            patch(
+                "custom_components.power_saver.coordinator.DataUpdateCoordinator.__init__"
+            ) as mock_init,
+            patch("custom_components.power_saver.coordinator._PowerSaverStore"),
+        ):
+            PowerSaverCoordinator(hass, entry)
+
+        debouncer = mock_init.call_args.kwargs["request_refresh_debouncer"]
+        assert debouncer.cooldown == EXPECTED_REQUEST_REFRESH_COOLDOWN_SECONDS
+        assert debouncer.immediate is False
+
     def test_setup_refresh_tracking_registers_hacs_listeners_once(self):
         """HACS setups should register Nord Pool and fallback listeners once."""
         coordinator = _make_coordinator_for_refresh_tracking()
@@ -250,13 +277,32 @@ class TestRefreshTracking:
             "custom_components.power_saver.coordinator.dt_util.utcnow",
             return_value=now,
         ):
-            coordinator._on_nordpool_update(MagicMock())
+            coordinator._on_nordpool_update(
+                MagicMock(data={"old_state": None, "new_state": MagicMock()})
+            )
 
         pending_unsub.assert_called_once()
         assert coordinator._unsub_delayed_clock_refresh is None
         assert coordinator._last_nordpool_refresh_request == now
         coordinator.async_request_refresh.assert_called_once()
-        coordinator.hass.async_create_task.assert_called_once()
+        coordinator.hass.async_create_background_task.assert_called_once()
+
+    def test_nordpool_update_without_price_change_is_ignored(self):
+        """Attribute-only Nord Pool updates with unchanged prices should not refresh."""
+        coordinator = _make_coordinator_for_refresh_tracking()
+        old_state = MagicMock(state="0.42", attributes={"raw_today": [1], "updated": 1})
+        same_prices = MagicMock(state="0.42", attributes={"raw_today": [1], "updated": 2})
+        new_prices = MagicMock(state="0.42", attributes={"raw_today": [2], "updated": 2})
+
+        coordinator._on_nordpool_update(
+            MagicMock(data={"old_state": old_state, "new_state": same_prices})
+        )
+        coordinator.async_request_refresh.assert_not_called()
+
+        coordinator._on_nordpool_update(
+            MagicMock(data={"old_state": old_state, "new_state": new_prices})
+        )
+        coordinator.async_request_refresh.assert_called_once()
 
     def test_native_update_cancels_pending_fallback(self):
         """Native coordinator updates should cancel the delayed fallback refresh."""
@@ -275,7 +321,7 @@ class TestRefreshTracking:
         assert coordinator._unsub_delayed_clock_refresh is None
         assert coordinator._last_nordpool_refresh_request == now
         coordinator.async_request_refresh.assert_called_once()
-        coordinator.hass.async_create_task.assert_called_once()
+        coordinator.hass.async_create_background_task.assert_called_once()
 
     def test_delayed_clock_refresh_requests_refresh(self):
         """Delayed fallback callback should request a coordinator refresh."""
@@ -285,8 +331,9 @@ class TestRefreshTracking:
         coordinator._on_clock_refresh_delay_elapsed(datetime(2026, 2, 6, 14, 0))
 
         assert coordinator._unsub_delayed_clock_refresh is None
-        coordinator.async_request_refresh.assert_called_once()
-        coordinator.hass.async_create_task.assert_called_once()
+        coordinator.async_refresh.assert_called_once()
+        coordinator.async_request_refresh.assert_not_called()
+        coordinator.hass.async_create_background_task.assert_called_once()
 
     async def test_shutdown_cancels_refresh_tracking_callbacks(self):
         """Shutdown should clean up all refresh listeners and pending callbacks."""
@@ -316,6 +363,72 @@ class TestRefreshTracking:
         assert coordinator._unsub_delayed_clock_refresh is None
         mock_super_shutdown.assert_awaited_once()
 
+    async def test_shutdown_waits_for_background_save(self):
+        """Shutdown should let an in-flight background save finish first."""
+        coordinator = _make_coordinator_for_refresh_tracking()
+        coordinator._store = MagicMock()
+        coordinator._store.async_save = AsyncMock()
+        pending = asyncio.Event()
+
+        async def _slow_save():
+            await pending.wait()
+
+        coordinator._save_task = asyncio.create_task(_slow_save())
+        asyncio.get_running_loop().call_soon(pending.set)
+
+        with patch(
+            "custom_components.power_saver.coordinator.DataUpdateCoordinator.async_shutdown",
+            new=AsyncMock(),
+        ):
+            await coordinator.async_shutdown()
+
+        assert coordinator._save_task is None
+        coordinator._store.async_save.assert_awaited_once()
+
+    async def test_save_state_skips_unchanged_state(self):
+        """Persisting the same state twice should only write storage once."""
+        coordinator = _make_coordinator_for_refresh_tracking()
+        coordinator._store = MagicMock()
+        coordinator._store.async_save = AsyncMock()
+
+        await coordinator._async_save_state()
+        await coordinator._async_save_state()
+        coordinator._store.async_save.assert_awaited_once()
+
+        coordinator._hours_override = 3.0
+        await coordinator._async_save_state()
+        assert coordinator._store.async_save.await_count == 2
+
+    async def test_control_entities_calls_each_domain_once(self):
+        """Controlled entities are switched with one call per entity domain."""
+        coordinator = _make_coordinator_for_refresh_tracking()
+        coordinator.config_entry.options = {
+            "controlled_entities": ["switch.heater", "light.lamp", "switch.pump"],
+        }
+        coordinator.hass.services.async_call = AsyncMock()
+
+        await coordinator._control_entities("active")
+
+        calls = coordinator.hass.services.async_call.await_args_list
+        assert [call.args for call in calls] == [
+            ("switch", "turn_on", {"entity_id": ["switch.heater", "switch.pump"]}),
+            ("light", "turn_on", {"entity_id": ["light.lamp"]}),
+        ]
+
+    async def test_control_entities_failure_does_not_skip_other_domains(self):
+        """A failing domain call is logged and the other domains still switch."""
+        coordinator = _make_coordinator_for_refresh_tracking()
+        coordinator.config_entry.options = {
+            "controlled_entities": ["switch.heater", "light.lamp"],
+        }
+        coordinator.hass.services.async_call = AsyncMock(
+            side_effect=[RuntimeError("boom"), None]
+        )
+
+        await coordinator._control_entities("standby")
+
+        assert coordinator.hass.services.async_call.await_count == 2
+
 
 class TestLockedSchedule:
     """Tests for the locked schedule behavior.
@@ -530,7 +643,7 @@ class TestShouldRecomputeSchedule:
         }
 
         with patch(
-            "custom_components.power_saver.coordinator.Store"
+            "custom_components.power_saver.coordinator._PowerSaverStore"
         ):
             coord = PowerSaverCoordinator(hass, entry)
         return coord
@@ -713,3 +826,27 @@ class TestShouldRecomputeSchedule:
         mock_coordinator._schedule_has_tomorrow = False
 
         assert mock_coordinator._should_recompute_schedule([], now) is True
+
+    def test_unchanged_tomorrow_prices_are_not_rescanned(
+        self, mock_coordinator, now, today_prices, tomorrow_prices
+    ):
+        """Tomorrow slots already checked against the locked schedule are skipped."""
+        mock_coordinator._locked_schedule = build_schedule(
+            raw_today=today_prices,
+            raw_tomorrow=tomorrow_prices,
+            min_hours=1.0,
+            now=now,
+        )
+        mock_coordinator._schedule_has_tomorrow = True
+        mock_coordinator._options_fingerprint = (
+            mock_coordinator._compute_options_fingerprint()
+        )
+
+        assert mock_coordinator._should_recompute_schedule(tomorrow_prices, now) is False
+        with patch(
+            "custom_components.power_saver.coordinator.scheduler._to_datetime",
+            side_effect=AssertionError("rescanned"),
+        ):
+            assert mock_coordinator._should_recompute_schedule(
+                list(tomorrow_prices), now
+            ) is False
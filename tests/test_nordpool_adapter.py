@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -14,8 +14,10 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.power_saver.const import NORDPOOL_TYPE_HACS, NORDPOOL_TYPE_NATIVE
 from custom_components.power_saver.nordpool_adapter import (
+    _async_fetch_native_date,
     _convert_native_response,
     _get_native_coordinator_prices,
+    _next_day_published,
     find_all_nordpool_sensors,
 )
 
@@ -671,3 +673,94 @@ class TestGetNativeCoordinatorPrices:
         today_prices, tomorrow_prices = result
         assert len(today_prices) == 1
         assert tomorrow_prices == []
+
+
+class TestNextDayPublished:
+    """Tests for the day-ahead publication check."""
+
+    @pytest.mark.parametrize(
+        ("now", "today", "published"),
+        [
+            # 11:59 and 12:00 in Stockholm
+            (datetime(2026, 3, 12, 11, 59, tzinfo=CET), date(2026, 3, 12), False),
+            (datetime(2026, 3, 12, 12, 0, tzinfo=CET), date(2026, 3, 12), True),
+            # UTC server after 23:00: Stockholm's next day is already published
+            (datetime(2026, 3, 12, 23, 30, tzinfo=timezone.utc), date(2026, 3, 12), True),
+            # UTC+9 just after midnight: Stockholm has not reached noon yet
+            (
+                datetime(2026, 3, 13, 1, 0, tzinfo=timezone(timedelta(hours=9))),
+                date(2026, 3, 13),
+                False,
+            ),
+        ],
+    )
+    def test_publication_in_ha_time_zone(self, now, today, published):
+        """The check should compare against noon Stockholm time on the HA date."""
+        with patch(
+            "custom_components.power_saver.nordpool_adapter.dt_util.now",
+            return_value=now,
+        ):
+            assert _next_day_published(today) is published
+
+
+class TestFetchNativeDate:
+    """Tests for the native get_prices_for_date fallback."""
+
+    async def test_published_prices_are_fetched_once(self):
+        """A date with published prices should not be requested again."""
+        hass = MagicMock()
+        hass.data = {}
+        hass.services.async_call = AsyncMock(
+            return_value={
+                "SE4": [
+                    {
+                        "start": "2026-02-06T00:00:00+01:00",
+                        "end": "2026-02-06T01:00:00+01:00",
+                        "price": 100.0,
+                    },
+                ]
+            }
+        )
+
+        first = await _async_fetch_native_date(hass, "entry_1", date(2026, 2, 6))
+        second = await _async_fetch_native_date(hass, "entry_1", date(2026, 2, 6))
+
+        assert first == second
+        assert len(first) == 1
+        hass.services.async_call.assert_awaited_once()
+
+    async def test_unpublished_prices_are_not_cached(self):
+        """An empty response (prices not published yet) should be retried."""
+        hass = MagicMock()
+        hass.data = {}
+        hass.services.async_call = AsyncMock(return_value={})
+
+        await _async_fetch_native_date(hass, "entry_1", date(2026, 2, 7))
+        await _async_fetch_native_date(hass, "entry_1", date(2026, 2, 7))
+
+        assert hass.services.async_call.await_count == 2
+
+    async def test_area_change_refetches_prices(self):
+        """Changing the Nord Pool entry's area should not reuse cached prices."""
+        hass = MagicMock()
+        hass.data = {}
+        nordpool_entry = MagicMock()
+        nordpool_entry.data = {"areas": ["SE3"], "currency": "SEK"}
+        hass.config_entries.async_get_entry.return_value = nordpool_entry
+        hass.services.async_call = AsyncMock(
+            return_value={
+                "SE3": [
+                    {
+                        "start": "2026-02-06T00:00:00+01:00",
+                        "end": "2026-02-06T01:00:00+01:00",
+                        "price": 100.0,
+                    },
+                ]
+            }
+        )
+
+        await _async_fetch_native_date(hass, "entry_1", date(2026, 2, 6))
+        nordpool_entry.data = {"areas": ["SE4"], "currency": "SEK"}
+        await _async_fetch_native_date(hass, "entry_1", date(2026, 2, 6))
+
+        assert hass.services.async_call.await_count == 2
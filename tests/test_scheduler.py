@@ -10,8 +10,9 @@ from __future__ import annotations
 import importlib
 import logging
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 import pytest
 
@@ -314,6 +315,57 @@ class TestFindCurrentSlot:
         assert current is not None
         assert current["price"] == 0.20
 
+    def test_last_slot_lasts_as_long_as_previous_gap(self):
+        """The last slot should end one slot length after its start."""
+        schedule = [
+            {"price": 0.10, "time": "2026-02-06T10:00:00+01:00", "status": "active"},
+            {"price": 0.20, "time": "2026-02-06T11:00:00+01:00", "status": "standby"},
+        ]
+        inside_last = datetime(2026, 2, 6, 11, 59, 0, tzinfo=TZ)
+        after_last = datetime(2026, 2, 6, 12, 0, 0, tzinfo=TZ)
+        assert find_current_slot(schedule, inside_last)["price"] == 0.20
+        assert find_current_slot(schedule, after_last) is None
+
+    @pytest.mark.parametrize(
+        ("strategy", "extra"),
+        [
+            ("lowest_price", {}),
+            ("lowest_price", {"period_from": "01:00", "period_to": "05:00"}),
+            ("minimum_runtime", {"max_hours_off": 4.0}),
+        ],
+    )
+    def test_repeated_hour_on_dst_change(self, strategy, extra):
+        """Slots in the repeated 02:00 hour should stay in time order."""
+        stockholm = ZoneInfo("Europe/Stockholm")
+        # 2026-10-25 has 25 hours in Stockholm: 02:00-03:00 occurs twice
+        day_start = datetime(2026, 10, 24, 22, 0, tzinfo=timezone.utc)
+        raw_today = []
+        for i in range(100):
+            start = day_start + timedelta(minutes=15 * i)
+            raw_today.append({
+                "start": start.astimezone(stockholm).isoformat(),
+                "end": (start + timedelta(minutes=15)).astimezone(stockholm).isoformat(),
+                "value": round(0.5 + (i % 7) * 0.01 + i * 0.001, 3),
+            })
+        # 02:20 in the second (standard time) occurrence of the repeated hour
+        now = datetime(2026, 10, 25, 2, 20, tzinfo=stockholm, fold=1)
+
+        schedule = build_schedule(
+            raw_today=raw_today,
+            raw_tomorrow=[],
+            min_hours=2.0,
+            now=now,
+            strategy=strategy,
+            **extra,
+        )
+
+        starts = [datetime.fromisoformat(s["time"]) for s in schedule]
+        assert len(starts) == 100
+        assert starts == sorted(starts)
+        current = find_current_slot(schedule, now)
+        assert current is not None
+        assert current["time"] == "2026-10-25T02:15:00+01:00"
+
 
 class TestFindNextChange:
     """Tests for find_next_change."""
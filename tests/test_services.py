@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import voluptuous as vol
 
+from homeassistant.core import HomeAssistant
+
 from helpers import make_config_entry
 
-from custom_components.power_saver.coordinator import PowerSaverCoordinator
+from custom_components.power_saver.coordinator import (
+    PowerSaverCoordinator,
+    PowerSaverData,
+    _PowerSaverStore,
+)
 
 
 # --- Coordinator hours override unit tests ---
@@ -43,20 +50,40 @@ async def test_async_set_hours_override():
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._last_on_time = None
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_refresh = AsyncMock()
         coordinator.logger = MagicMock()
 
         await coordinator.async_set_hours_override(18.0)
 
         assert coordinator._hours_override == 18.0
         assert coordinator._locked_schedule is None  # Schedule invalidated
-        coordinator.async_request_refresh.assert_awaited_once()
+        coordinator.async_refresh.assert_awaited_once()
         coordinator._store.async_save.assert_awaited_once()
         # Verify saved data includes the override
         saved_data = coordinator._store.async_save.call_args[0][0]
         assert saved_data["hours_override"] == 18.0
 
 
+async def test_hours_override_updates_data_before_returning(hass: HomeAssistant):
+    """Test the service override recomputes the schedule before the call returns."""
+    entry = make_config_entry()
+    entry.options = {}
+    entry.data = {"nordpool_sensor": "sensor.nordpool", "name": "Test", "nordpool_type": "hacs"}
+    coordinator = PowerSaverCoordinator(hass, entry)
+    recomputed = PowerSaverData(active_slots=72)
+
+    with (
+        patch.object(coordinator, "_async_save_state", AsyncMock()),
+        patch.object(
+            coordinator, "_async_update_data", AsyncMock(return_value=recomputed)
+        ) as mock_update,
+    ):
+        await coordinator.async_set_hours_override(18.0)
+
+    mock_update.assert_awaited_once()
+    assert coordinator.data is recomputed
+
+
 async def test_async_clear_hours_override():
     """Test clearing hours override removes value and triggers refresh."""
     hass = MagicMock()
@@ -75,14 +102,14 @@ async def test_async_clear_hours_override():
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._last_on_time = None
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_refresh = AsyncMock()
         coordinator.logger = MagicMock()
 
         await coordinator.async_clear_hours_override()
 
         assert coordinator._hours_override is None
         assert coordinator._locked_schedule is None  # Schedule invalidated
-        coordinator.async_request_refresh.assert_awaited_once()
+        coordinator.async_refresh.assert_awaited_once()
         saved_data = coordinator._store.async_save.call_args[0][0]
         assert saved_data["hours_override"] is None
 
@@ -167,6 +194,51 @@ async def test_hours_override_not_restored_when_absent():
         assert coordinator._hours_override is None
 
 
+async def test_last_on_time_restored_from_timestamp():
+    """Test last_on_time loads from its stored Unix timestamp as UTC."""
+    hass = MagicMock()
+    entry = make_config_entry()
+    entry.options = {}
+    entry.data = {"nordpool_sensor": "sensor.nordpool", "name": "Test", "nordpool_type": "hacs"}
+
+    with patch(
+        "custom_components.power_saver.coordinator.DataUpdateCoordinator.__init__"
+    ):
+        coordinator = PowerSaverCoordinator.__new__(PowerSaverCoordinator)
+        coordinator.hass = hass
+        coordinator.config_entry = entry
+        coordinator._hours_override = None
+        coordinator._last_on_time = None
+        coordinator._store = MagicMock()
+        coordinator._store.async_load = AsyncMock(
+            return_value={"last_on_time": 1770388200.0}
+        )
+        coordinator.logger = MagicMock()
+
+        await coordinator._async_load_state()
+
+        assert coordinator._last_on_time.timestamp() == 1770388200.0
+        assert coordinator._last_on_time.utcoffset() == timedelta(0)
+
+
+@pytest.mark.parametrize(
+    ("stored", "migrated"),
+    [
+        ("2026-02-06T15:30:00+01:00", 1770388200.0),
+        ("not-a-date", None),
+        (None, None),
+    ],
+)
+async def test_store_migrates_iso_last_on_time(stored, migrated):
+    """Test storage minor version 1 ISO last_on_time is migrated to a timestamp."""
+    store = _PowerSaverStore.__new__(_PowerSaverStore)
+    data = await store._async_migrate_func(
+        2, 1, {"last_on_time": stored, "hours_override": 3.0}
+    )
+
+    assert data == {"last_on_time": migrated, "hours_override": 3.0}
+
+
 def test_hours_override_property():
     """Test the hours_override property returns current value."""
     hass = MagicMock()
@@ -219,7 +291,7 @@ async def test_async_set_exclude_times_override():
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._last_on_time = None
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_refresh = AsyncMock()
         coordinator.logger = MagicMock()
 
         await coordinator.async_set_exclude_times_override("22:00", "06:00")
@@ -227,7 +299,7 @@ async def test_async_set_exclude_times_override():
         assert coordinator._exclude_from_override == "22:00"
         assert coordinator._exclude_until_override == "06:00"
         assert coordinator._locked_schedule is None
-        coordinator.async_request_refresh.assert_awaited_once()
+        coordinator.async_refresh.assert_awaited_once()
         coordinator._store.async_save.assert_awaited_once()
         saved_data = coordinator._store.async_save.call_args[0][0]
         assert saved_data["exclude_from_override"] == "22:00"
@@ -254,7 +326,7 @@ async def test_async_clear_exclude_times_override():
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._last_on_time = None
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_refresh = AsyncMock()
         coordinator.logger = MagicMock()
 
         await coordinator.async_clear_exclude_times_override()
@@ -262,7 +334,7 @@ async def test_async_clear_exclude_times_override():
         assert coordinator._exclude_from_override is None
         assert coordinator._exclude_until_override is None
         assert coordinator._locked_schedule is None
-        coordinator.async_request_refresh.assert_awaited_once()
+        coordinator.async_refresh.assert_awaited_once()
         saved_data = coordinator._store.async_save.call_args[0][0]
         assert saved_data["exclude_from_override"] is None
         assert saved_data["exclude_until_override"] is None